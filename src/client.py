@@ -1,22 +1,36 @@
 import logging
 import re
+import threading
 import time
+from collections import deque
 from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
+import orjson
 from keboola.component.dao import OauthCredentials
 from keboola.component.exceptions import UserException
 from keboola.http_client import HttpClient
-from requests import HTTPError, RequestException
-from requests.exceptions import RetryError
+from requests import HTTPError, RequestException, Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import JSONDecodeError, RetryError, Timeout
+from urllib3.util import Retry
 
 from configuration import Account, QueryRow
 from output_parser import OutputParser
 from page_loader import (
+    _ASYNC_JOB_COMPLETED,
+    _ASYNC_JOB_FAILED_STATUSES,
+    _ASYNC_POLL_TIMEOUT,
     _FB_TRANSIENT_ERROR_BACKOFF_BASE,
     _FB_TRANSIENT_ERROR_MAX_RETRIES,
     AsyncInsightsJobTransientError,
+    AsyncPollCancelled,
+    CircuitOpenError,
     PageLoader,
+    async_poll_delay,
+    sleep_unless_cancelled,
 )
 
 # Errors that mean "this one object failed transiently / at the API" — contain them
@@ -25,6 +39,30 @@ from page_loader import (
 # intentionally NOT here, so they still propagate.
 _CONTAINED_OBJECT_ERRORS = (HTTPError, RetryError, RequestException, AsyncInsightsJobTransientError)
 
+# Upper bound on concurrent async-insights report starts/polls. Each worker mostly sleeps on
+# Graph API round-trips or the poll interval, so overlapping them turns K·RTT into ~RTT.
+_ASYNC_JOB_MAX_WORKERS = 16
+
+# Sync queries load the first page of up to this many objects concurrently, ahead of the
+# (serial) pagination and parsing, which bounds how many unparsed first pages are held at once.
+_SYNC_FIRST_PAGE_WORKERS = _ASYNC_JOB_MAX_WORKERS
+
+# Keep-alive connections held open to graph.facebook.com; sized to the async worker pool so
+# concurrent polls don't overflow the pool and discard connections.
+_HTTP_POOL_MAXSIZE = 2 * _ASYNC_JOB_MAX_WORKERS
+
+# Consecutive exhausted-retry / connection failures after which calls to the Graph API are
+# short-circuited, and how long (seconds) to wait before letting requests probe it again.
+_CIRCUIT_FAILURE_THRESHOLD = 5
+_CIRCUIT_RESET_TIMEOUT = 30.0
+
+# Graph API caps `?ids=` multi-gets at 50 objects per request.
+_IDS_BATCH_SIZE = 50
+
+# Async report statuses fetched per `GET /?ids=...` multi-get (polled on the same jittered
+# backoff schedule as PageLoader.poll_async_job).
+_ASYNC_STATUS_BATCH_SIZE = _IDS_BATCH_SIZE
+
 # Ads Insights breakdowns that Meta requires each ad account to explicitly enable in Ads
 # Manager, effective 2026-08-06 (SUPPORT-17071 / CFTL-735). Until an account enables one,
 # the Marketing API returns *no rows* for that breakdown (in both the sync and async APIs);
@@ -56,6 +94,10 @@ def breakdowns_requiring_enablement(query_config) -> list[str]:
     return [breakdown for breakdown in BREAKDOWNS_REQUIRING_ENABLEMENT if breakdown in haystack]
 
 
+_TOKEN_RE_QS = re.compile(r"access_token=[^&\s]+")
+_TOKEN_RE_DICT = re.compile(r"'access_token': '[^']+'")
+
+
 class AccessTokenFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         record.msg = self._mask(record.msg)
@@ -66,12 +108,18 @@ class AccessTokenFilter(logging.Filter):
 
     def _mask(self, obj):
         if isinstance(obj, str):
-            obj = re.sub(r"access_token=[^&\s]+", "access_token=---ACCESS-TOKEN---", obj)
-            return re.sub(r"'access_token': '[^']+'", "'access_token': '---ACCESS-TOKEN---'", obj)
+            # Nearly every log line carries no token; skip the regex work for those.
+            if "access_token" not in obj:
+                return obj
+            obj = _TOKEN_RE_QS.sub("access_token=---ACCESS-TOKEN---", obj)
+            return _TOKEN_RE_DICT.sub("'access_token': '---ACCESS-TOKEN---'", obj)
 
         if isinstance(obj, Exception):
             # Convert exception to string and mask it
-            masked_str = self._mask(str(obj))
+            exc_str = str(obj)
+            if "access_token" not in exc_str:
+                return obj
+            masked_str = self._mask(exc_str)
             # Try to create new exception with masked message
             try:
                 return type(obj)(masked_str)
@@ -80,6 +128,8 @@ class AccessTokenFilter(logging.Filter):
                 return masked_str
 
         if isinstance(obj, tuple):
+            if not any(isinstance(v, str | Exception | tuple) for v in obj):
+                return obj
             return type(obj)(self._mask(v) for v in obj)
 
         return obj
@@ -90,10 +140,158 @@ access_token_filter = AccessTokenFilter()
 # Create module logger after filter is set up
 logger = logging.getLogger(__name__)
 
-# Add filter to root logger and all existing loggers
-logging.getLogger().addFilter(access_token_filter)
-for name in logging.root.manager.loggerDict:
-    logging.getLogger(name).addFilter(access_token_filter)
+
+def install_access_token_filter() -> None:
+    """Attach the token filter to the root logger and each of its handlers.
+
+    Logger filters only see records logged on that exact logger, not ones propagated from
+    children, so the handlers are what actually guard every line that gets written. Call
+    again after logging handlers are (re)configured; ``addFilter`` ignores duplicates.
+    """
+    root = logging.getLogger()
+    root.addFilter(access_token_filter)
+    for handler in root.handlers:
+        handler.addFilter(access_token_filter)
+
+
+install_access_token_filter()
+
+
+def _copy_future_outcome(source: Future, target: Future) -> None:
+    """Resolve ``target`` with the result or exception of the finished ``source`` future."""
+    if source.cancelled():
+        target.cancel()
+    elif (error := source.exception()) is not None:
+        target.set_exception(error)
+    else:
+        target.set_result(source.result())
+
+
+class CircuitBreaker:
+    """Thread-safe closed / open / half-open breaker over consecutive Graph API outages.
+
+    Each failure is already a request whose urllib3 retries were exhausted, so a handful in a
+    row means the backend is down. While open, calls raise ``CircuitOpenError`` (failing the run)
+    instead of spending the retry budget again. Once ``reset_timeout`` has passed the breaker is
+    half-open and lets a single probe through: its success closes the breaker, its failure
+    re-opens it. 4xx responses never count as failures.
+    """
+
+    def __init__(
+        self, failure_threshold: int = _CIRCUIT_FAILURE_THRESHOLD, reset_timeout: float = _CIRCUIT_RESET_TIMEOUT
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._probe_in_flight or time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError(
+                    f"Facebook API is temporarily unavailable ({self._failures} consecutive requests failed "
+                    "after retries). Try again later."
+                )
+            self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Graph API responded again; closing circuit breaker")
+            self._failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            # A failed half-open probe re-opens immediately.
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning(f"Graph API failed {self._failures} times in a row; opening circuit breaker")
+                self._opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        """Let another probe through after one ended without telling us anything about the API."""
+        with self._lock:
+            self._probe_in_flight = False
+
+
+class PooledHttpClient(HttpClient):
+    """HttpClient that keeps one pooled, retrying ``HTTPAdapter`` for its whole lifetime.
+
+    ``keboola.http_client.HttpClient`` mounts a brand-new adapter (and so a brand-new connection
+    pool) on every request, so each Graph API call pays a fresh TCP + TLS handshake. The
+    connection pool lives in the adapter, so mounting the same adapter on the per-request session
+    lets all calls share kept-alive connections while headers/auth stay per-request.
+
+    All requests also go through one ``CircuitBreaker``, so a Graph API outage fails the run
+    fast instead of spending the full retry budget on each remaining object.
+    """
+
+    def __init__(self, *args, pool_maxsize: int = _HTTP_POOL_MAXSIZE, breaker: CircuitBreaker | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool_maxsize = pool_maxsize
+        self._adapter: HTTPAdapter | None = None
+        self._adapter_lock = threading.Lock()
+        self.breaker = breaker or CircuitBreaker()
+
+    def _request_raw(self, method: str, endpoint_path: str | None = None, **kwargs):
+        self.breaker.before_request()
+        try:
+            response = super()._request_raw(method, endpoint_path, **kwargs)
+        except (RetryError, RequestsConnectionError, Timeout):
+            self.breaker.record_failure()
+            raise
+        except Exception:
+            self.breaker.release_probe()
+            raise
+        # Any HTTP response, 4xx included, shows the API is reachable.
+        self.breaker.record_success()
+        return response
+
+    def _get_adapter(self) -> HTTPAdapter:
+        with self._adapter_lock:
+            if self._adapter is None:
+                retry = Retry(
+                    total=self.max_retries,
+                    read=self.max_retries,
+                    connect=self.max_retries,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=self.status_forcelist,
+                    allowed_methods=self.allowed_methods,
+                )
+                self._adapter = HTTPAdapter(max_retries=retry, pool_maxsize=self._pool_maxsize)
+            return self._adapter
+
+    def get(self, endpoint_path: str | None = None, params: dict | None = None, **kwargs) -> Any:
+        """GET and decode the JSON body with orjson; same contract as ``HttpClient.get``.
+
+        Insights pages can be several MB, and decoding them is the main CPU cost of a run.
+        Decode errors are re-raised as ``requests``' ``JSONDecodeError`` like ``response.json()``.
+        """
+        response = self.get_raw(endpoint_path, params=params, **kwargs)
+        try:
+            response.raise_for_status()
+        except HTTPError as e:
+            logger.warning(e, exc_info=True)
+            raise
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+    def _requests_retry_session(self, session=None):
+        session = session or Session()
+        adapter = self._get_adapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
 
 class PageTokenResolver:
@@ -141,6 +339,8 @@ class PageTokenResolver:
                     # Look up page token using account.id
                     page_tokens[account.id] = page_token_map.get(account.id, user_token)
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             logger.warning(f"Unable to get page tokens: {e}")
             # Fallback to user token for all accounts
@@ -157,6 +357,7 @@ class FacebookClient:
         # CFTL-630: forwarded to every OutputParser this client builds.
         self.v1_compatibility = v1_compatibility
         self.page_tokens = None  # Cache for page tokens
+        self._accounts_by_id: dict[str, Account] = {}
         # Count of objects skipped due to contained API errors; surfaced as an
         # end-of-run warning so partial output is not silently read as complete.
         self.skipped_objects = 0
@@ -164,8 +365,9 @@ class FacebookClient:
         if self.oauth.data and self.oauth.data.get("token", None) and not self.oauth.data.get("access_token", None):
             logger.info("Direct insert token is used for authentication.")
             self.oauth.data["access_token"] = self.oauth.data["token"]
+        self._user_token = self.oauth.data.get("access_token") if self.oauth.data else None
 
-        self.client = HttpClient(
+        self.client = PooledHttpClient(
             base_url="https://graph.facebook.com",
             default_http_header={"Content-Type": "application/json"},
             status_forcelist=(500, 502, 503, 504),
@@ -176,8 +378,11 @@ class FacebookClient:
         Return a copy of params with the access_token added.
         If token is not provided, use the main user access token.
         """
-        params = dict(params) if params else {}
-        params["access_token"] = token or self.oauth.data.get("access_token")
+        return self._with_token_inplace(dict(params) if params else {}, token)
+
+    def _with_token_inplace(self, params: dict[str, Any], token: str | None = None) -> dict[str, Any]:
+        """Add the access_token to a caller-owned params dict and return that same dict."""
+        params["access_token"] = token or self._user_token
         return params
 
     def _extract_page_content(self, query_path: str | None, page_data: dict[str, Any]) -> list[dict[str, Any]]:
@@ -192,9 +397,10 @@ class FacebookClient:
     def process_queries(self, accounts: list, queries: list) -> Iterator[dict]:
         """
         Processes a list of queries, handling sync and async execution.
-        Async queries are started in parallel, then all results are polled.
-        Sync queries are processed sequentially after all async jobs are handled.
+        Async queries are started first, sync queries then run while Facebook computes the
+        async reports server-side, and finally all async results are polled.
         """
+        self._accounts_by_id = {account.id: account for account in accounts}
         async_queries = []
         sync_queries = []
         for query in queries:
@@ -212,23 +418,27 @@ class FacebookClient:
                 job_details = self._start_async_jobs_for_query(accounts, query)
                 all_job_details.update(job_details)
 
+        # Process sync queries while the async reports are being computed
+        for query in sync_queries:
+            logger.info(f"Processing sync query: {query.name}")
+            yield from self._process_single_sync_query(accounts, query)
+
         # Poll and process async results
         if all_job_details:
             logger.info(f"Polling and processing {len(all_job_details)} async jobs.")
             yield from self._poll_and_process_async_jobs(all_job_details)
 
-        # Process sync queries
-        for query in sync_queries:
-            logger.info(f"Processing sync query: {query.name}")
-            yield from self._process_single_sync_query(accounts, query)
+    def _select_accounts(self, accounts: list[Account], ids_str: str) -> list[Account]:
+        """Look up the accounts named in a query's ``ids`` (deduplicated, in ``ids`` order)."""
+        accounts_by_id = self._accounts_by_id or {account.id: account for account in accounts}
+        return [accounts_by_id[i] for i in dict.fromkeys(ids_str.split(",")) if i in accounts_by_id]
 
     def _start_async_jobs_for_query(self, accounts: list, row_config) -> dict:
         if ids_str := row_config.query.ids:
-            selected_ids = {id for id in ids_str.split(",")}
-            accounts = [account for account in accounts if account.id in selected_ids]
+            accounts = self._select_accounts(accounts, ids_str)
 
         # Resolve tokens
-        user_token = self.oauth.data.get("access_token")
+        user_token = self._user_token
         if self._request_require_page_token(row_config):
             is_page_token = True
             if self.page_tokens is None:
@@ -239,46 +449,169 @@ class FacebookClient:
         else:
             is_page_token = False
             page_tokens = {account.id: user_token for account in accounts}
-        job_details = {}
-        for page_id, token in page_tokens.items():
-            page_id = str(page_id)
+        fb_graph_node = self._get_fb_graph_node(is_page_token, row_config)
+        # One loader per query: it is stateless apart from the params it builds once for the query
+        page_loader = PageLoader(self.client, row_config.type, self.api_version)
+
+        def start_job(page_id: str, token: str) -> tuple[str | None, dict]:
+            # Use the shared client and pass token in params
+            start_params = self._with_token_inplace({}, token)
             try:
-                # Use the shared client and pass token in params
-                page_loader = PageLoader(self.client, row_config.type, self.api_version)
-                report_id = page_loader.start_async_insights_job(
-                    row_config.query, page_id, params=self._with_token({}, token)
-                )
-                if report_id:
-                    job_details[report_id] = {
-                        "page_id": page_id,
-                        "page_loader": page_loader,
-                        "output_parser": OutputParser(page_loader, page_id, row_config, self.v1_compatibility),
-                        "fb_graph_node": self._get_fb_graph_node(is_page_token, row_config),
-                        "access_token": token,
-                        # Needed to re-submit the report on a transient poll failure.
-                        "row_config": row_config,
-                        "start_params": self._with_token({}, token),
-                    }
+                report_id = page_loader.start_async_insights_job(row_config.query, page_id, params=start_params)
+            except CircuitOpenError:
+                raise
             except Exception as e:
                 logger.error(f"Failed to start async job for {page_id}: {e}")
+                return None, {}
+            return report_id, {
+                "page_id": page_id,
+                "page_loader": page_loader,
+                "output_parser": OutputParser(page_loader, page_id, row_config, self.v1_compatibility),
+                "fb_graph_node": fb_graph_node,
+                "access_token": token,
+                # Needed to re-submit the report on a transient poll failure.
+                "row_config": row_config,
+                "start_params": start_params,
+            }
+
+        # Start every report concurrently; map() keeps submission order so job_details (and
+        # therefore output row order) stays deterministic.
+        page_ids = [str(page_id) for page_id in page_tokens]
+        job_details = {}
+        with ThreadPoolExecutor(max_workers=_ASYNC_JOB_MAX_WORKERS) as executor:
+            for report_id, details in executor.map(start_job, page_ids, page_tokens.values()):
+                if report_id:
+                    job_details[report_id] = details
+                else:
+                    # The report never started (already logged); its rows are missing from the output.
+                    self.skipped_objects += 1
         return job_details
 
     def _poll_and_process_async_jobs(self, all_job_details: dict) -> Iterator[dict]:
+        """Poll all async reports concurrently and parse their results in submission order.
+
+        A status thread polls the pending reports with batched multi-gets and hands each one to a
+        worker as soon as its fate is known; the worker fetches its results, or polls and
+        re-submits it. Parsing — including result pagination — stays on the calling thread so rows
+        are yielded in a deterministic order, and a report is parsed as soon as it and the reports
+        before it are ready, while later ones are still being computed.
+        """
+        if not all_job_details:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(_ASYNC_JOB_MAX_WORKERS, len(all_job_details)))
+        outcomes: dict[str, Future] = {report_id: Future() for report_id in all_job_details}
+        # One polling budget per report: a report handed over when the batched poll gives up
+        # is not polled for another full timeout before it gets re-submitted.
+        deadline = time.monotonic() + _ASYNC_POLL_TIMEOUT
+        # Set when this generator exits (normally, on an error or when closed) so in-flight polls,
+        # backoffs and re-submits stop instead of running out their multi-minute budgets.
+        cancel = threading.Event()
+
+        def dispatch(report_id: str, completed: bool) -> None:
+            worker = executor.submit(
+                self._poll_async_with_resubmit, report_id, all_job_details[report_id], completed, deadline, cancel
+            )
+            worker.add_done_callback(lambda done, outcome=outcomes[report_id]: _copy_future_outcome(done, outcome))
+
+        status_thread = threading.Thread(
+            target=self._dispatch_async_jobs_by_status,
+            args=(all_job_details, dispatch, deadline, cancel),
+            name="async-status",
+            daemon=True,
+        )
+        status_thread.start()
+        try:
+            for report_id, details in all_job_details.items():
+                page_id = details["page_id"]
+                try:
+                    page_data = outcomes[report_id].result()
+                    if not page_data.get("data"):
+                        self._warn_if_breakdown_enablement_needed(details.get("row_config"), page_id)
+                        continue
+                    yield from details["output_parser"].iter_parsed_data(page_data, details["fb_graph_node"], page_id)
+                except _CONTAINED_OBJECT_ERRORS as e:
+                    # Transient/API failure for this one report — contain it so the rest of the
+                    # run completes; UserException and programming errors still propagate.
+                    logger.error(
+                        f"Skipping async report {report_id} (object {page_id}) after errors: {type(e).__name__}: {e}"
+                    )
+                    self.skipped_objects += 1
+        finally:
+            cancel.set()
+            status_thread.join()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _dispatch_async_jobs_by_status(
+        self, all_job_details: dict, dispatch, deadline: float, cancel: threading.Event
+    ) -> None:
+        """Batch-poll async report statuses, calling ``dispatch(report_id, completed)`` once per report.
+
+        Statuses are fetched for up to ``_ASYNC_STATUS_BATCH_SIZE`` reports per request (grouped by
+        access token), so N pending reports cost ceil(N/50) requests per poll round instead of N.
+        Completed reports are dispatched with ``completed=True`` straight away. Reports that fail,
+        are skipped or are missing from the response are dispatched to the per-report poll, which
+        owns the resubmit logic; so are reports still pending at ``deadline`` (which re-submits them
+        at once) and, if the multi-get itself fails, every remaining report. Nothing more is
+        dispatched once ``cancel`` is set.
+        """
+        pending: dict[str, set[str]] = {}
         for report_id, details in all_job_details.items():
-            page_id = details["page_id"]
-            try:
-                page_data = self._poll_async_with_resubmit(report_id, details)
-                if not page_data.get("data"):
-                    self._warn_if_breakdown_enablement_needed(details.get("row_config"), page_id)
-                    continue
-                yield from details["output_parser"].iter_parsed_data(page_data, details["fb_graph_node"], page_id)
-            except _CONTAINED_OBJECT_ERRORS as e:
-                # Transient/API failure for this one report — contain it so the rest of the
-                # run completes; UserException and programming errors still propagate.
-                logger.error(
-                    f"Skipping async report {report_id} (object {page_id}) after errors: {type(e).__name__}: {e}"
-                )
-                self.skipped_objects += 1
+            access_token = details.get("access_token", self._user_token)
+            pending.setdefault(access_token, set()).add(report_id)
+
+        try:
+            attempt = 0
+            while True:
+                # Highest completion among still-pending reports; shortens the wait when one is nearly done
+                max_pending_percent = 0
+                for access_token, report_ids in pending.items():
+                    statuses = self._poll_async_statuses_batched(sorted(report_ids), access_token)
+                    for report_id in sorted(report_ids):
+                        status = statuses.get(report_id)
+                        if status is None:
+                            # Not returned (or errored) in the multi-get — let the per-report poll handle it.
+                            report_ids.discard(report_id)
+                            dispatch(report_id, False)
+                            continue
+                        async_status = status.get("async_status", "Unknown")
+                        logger.info(
+                            f"Async job {report_id}: {status.get('async_percent_completion', 0)}% complete, "
+                            f"status: {async_status}"
+                        )
+                        if async_status == _ASYNC_JOB_COMPLETED:
+                            report_ids.discard(report_id)
+                            dispatch(report_id, True)
+                        elif async_status in _ASYNC_JOB_FAILED_STATUSES:
+                            report_ids.discard(report_id)
+                            dispatch(report_id, False)
+                        else:
+                            max_pending_percent = max(max_pending_percent, status.get("async_percent_completion") or 0)
+                pending = {token: report_ids for token, report_ids in pending.items() if report_ids}
+                if not pending or time.monotonic() >= deadline:
+                    break
+                sleep_unless_cancelled(async_poll_delay(attempt, max_pending_percent), cancel)
+                attempt += 1
+        except AsyncPollCancelled:
+            return
+        except Exception as e:
+            logger.warning(f"Batched async status poll failed ({e}); falling back to per-report polling")
+
+        remaining = set().union(*pending.values())
+        for report_id in all_job_details:
+            if report_id in remaining:
+                dispatch(report_id, False)
+
+    def _poll_async_statuses_batched(self, report_ids: list[str], access_token: str) -> dict[str, dict]:
+        """Fetch ``async_status``/``async_percent_completion`` for many reports via ``?ids=`` multi-get."""
+        statuses: dict[str, dict] = {}
+        for i in range(0, len(report_ids), _ASYNC_STATUS_BATCH_SIZE):
+            chunk = report_ids[i : i + _ASYNC_STATUS_BATCH_SIZE]
+            params = {"ids": ",".join(chunk), "fields": "async_status,async_percent_completion"}
+            response = self.client.get(f"/{self.api_version}/", params=self._with_token_inplace(params, access_token))
+            if not isinstance(response, dict):
+                raise TypeError(f"unexpected batched status response: {type(response).__name__}")
+            statuses.update({k: v for k, v in response.items() if isinstance(v, dict) and "error" not in v})
+        return statuses
 
     def _warn_if_breakdown_enablement_needed(self, row_config, page_id: str) -> None:
         """Explain an empty async result that is likely caused by an un-enabled breakdown.
@@ -299,7 +632,14 @@ class FacebookClient:
             f"see https://developers.facebook.com/docs/marketing-api/insights/breakdowns"
         )
 
-    def _poll_async_with_resubmit(self, report_id: str, details: dict) -> dict[str, Any]:
+    def _poll_async_with_resubmit(
+        self,
+        report_id: str,
+        details: dict,
+        completed: bool = False,
+        deadline: float | None = None,
+        cancel: threading.Event | None = None,
+    ) -> dict[str, Any]:
         """Poll an async report, re-submitting it with exponential backoff on transient failures.
 
         Facebook fails report jobs transiently under load ("Job Failed"/"Job Skipped"/timeout);
@@ -307,12 +647,20 @@ class FacebookClient:
         report and re-poll. Once the retry budget is exhausted the last error propagates and the
         caller contains it (skip + count). This is the *production* retry path — the previous
         loop in ``PageLoader._load_async_insights`` was never reached by a real job.
+
+        ``completed`` means the batched status poll already saw the report finish, so its
+        results are fetched directly without another status round-trip. ``deadline`` bounds the
+        first poll (the budget the batched poll already started); re-submitted reports get a
+        fresh one. Setting ``cancel`` stops polling, backoff and re-submission with
+        ``AsyncPollCancelled``.
         """
         page_loader = details["page_loader"]
-        access_token = details.get("access_token", self.oauth.data.get("access_token"))
+        access_token = details.get("access_token", self._user_token)
+        if completed:
+            return page_loader.get_async_job_results(report_id, access_token)
         for attempt in range(_FB_TRANSIENT_ERROR_MAX_RETRIES + 1):
             try:
-                return page_loader.poll_async_job(report_id, access_token)
+                return page_loader.poll_async_job(report_id, access_token, deadline, cancel)
             except AsyncInsightsJobTransientError as e:
                 if attempt >= _FB_TRANSIENT_ERROR_MAX_RETRIES:
                     raise
@@ -321,14 +669,53 @@ class FacebookClient:
                     f"Async report {report_id} transiently failed ({e}); resubmitting, "
                     f"attempt {attempt + 2}/{_FB_TRANSIENT_ERROR_MAX_RETRIES + 1}, retrying in {wait}s"
                 )
-                time.sleep(wait)
+                sleep_unless_cancelled(wait, cancel)
+                deadline = None
                 report_id = page_loader.start_async_insights_job(
                     details["row_config"].query, details["page_id"], params=details["start_params"]
                 )
                 if not report_id:
-                    return {"data": []}
+                    # Counted as skipped by the caller rather than passing for an empty report.
+                    raise AsyncInsightsJobTransientError(
+                        f"re-submitting the report for {details['page_id']} failed"
+                    ) from e
         return {"data": []}  # unreachable — loop always returns or raises
 
+    def _fetch_batch_responses(self, account_ids: list[str], fields: str | None) -> list[dict] | None:
+        """Fetch ``?ids=`` multi-get responses in chunks of ``_IDS_BATCH_SIZE``, concurrently.
+
+        Responses are returned in chunk order. Returns None if any chunk comes back empty or
+        malformed. Raises HTTPError on failure so the caller can handle fallbacks.
+        """
+        chunks = [account_ids[i : i + _IDS_BATCH_SIZE] for i in range(0, len(account_ids), _IDS_BATCH_SIZE)]
+
+        def fetch(chunk: list[str]) -> Any:
+            params = {"ids": ",".join(chunk), "fields": fields}
+            return self.client.get(f"/{self.api_version}/", params=self._with_token_inplace(params))
+
+        if len(chunks) == 1:
+            responses = [fetch(chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_ASYNC_JOB_MAX_WORKERS, len(chunks))) as executor:
+                responses = list(executor.map(fetch, chunks))
+
+        if not all(response and isinstance(response, dict) for response in responses):
+            return None
+        return responses
+
+    def _iter_batch_responses(self, responses: list[dict], row_config) -> Iterator[dict]:
+        """Parse every object of the multi-get responses, skipping per-id errors."""
+        fb_graph_node = self._get_fb_graph_node(False, row_config)
+        for response in responses:
+            for item_id, item_data in response.items():
+                if isinstance(item_data, dict) and "error" in item_data:
+                    logger.warning(f"Error fetching data for ID {item_id}: {item_data['error']}")
+                    continue
+                output_parser = OutputParser(
+                    page_loader=None, page_id=item_id, row_config=row_config, v1_compatibility=self.v1_compatibility
+                )
+                yield from output_parser.iter_parsed_data(response=item_data, fb_node=fb_graph_node, parent_id=item_id)
+
     def _handle_batch_request(self, account_ids: list[str], row_config) -> Iterator[dict]:
         """
         Executes and parses a batch request for a list of account IDs.
@@ -336,25 +723,11 @@ class FacebookClient:
         Raises HTTPError on failure so the caller can handle fallbacks.
         """
         logger.info(f"Batch fetching object details for IDs: {','.join(account_ids)}")
-        params = {"ids": ",".join(account_ids), "fields": row_config.query.fields}
-
-        # Raises HTTPError on failure
-        response = self.client.get(f"/{self.api_version}/", params=self._with_token(params))
-
-        if not response or not isinstance(response, dict):
+        responses = self._fetch_batch_responses(account_ids, row_config.query.fields)
+        if responses is None:
             logger.warning("Empty or invalid response for batch ID fetch.")
             return
-
-        fb_graph_node = self._get_fb_graph_node(False, row_config)
-        for item_id, item_data in response.items():
-            if isinstance(item_data, dict) and "error" in item_data:
-                logger.warning(f"Error fetching data for ID {item_id}: {item_data['error']}")
-                continue
-
-            output_parser = OutputParser(
-                page_loader=None, page_id=item_id, row_config=row_config, v1_compatibility=self.v1_compatibility
-            )
-            yield from output_parser.iter_parsed_data(response=item_data, fb_node=fb_graph_node, parent_id=item_id)
+        yield from self._iter_batch_responses(responses, row_config)
 
     def _process_single_sync_query(self, accounts: list[Account], row_config: QueryRow) -> Iterator[dict[str, Any]]:
         # Determine if a query is eligible for batch processing.
@@ -371,31 +744,12 @@ class FacebookClient:
             if account_ids:
                 try:
                     logger.info(f"Attempting to batch fetch data for {len(account_ids)} IDs.")
-                    params = {
-                        "ids": ",".join(account_ids),
-                        "fields": row_config.query.fields,
-                    }
-                    response = self.client.get(f"/{self.api_version}/", params=self._with_token(params))
+                    responses = self._fetch_batch_responses(account_ids, row_config.query.fields)
 
-                    if not response or not isinstance(response, dict):
+                    if responses is None:
                         logger.warning("Empty or invalid response for batch ID fetch.")
                     else:
-                        fb_graph_node = self._get_fb_graph_node(False, row_config)
-                        for item_id, item_data in response.items():
-                            if isinstance(item_data, dict) and "error" in item_data:
-                                logger.warning(f"Error fetching data for ID {item_id}: {item_data['error']}")
-                                continue
-                            output_parser = OutputParser(
-                                page_loader=None,
-                                page_id=item_id,
-                                row_config=row_config,
-                                v1_compatibility=self.v1_compatibility,
-                            )
-                            yield from output_parser.iter_parsed_data(
-                                response=item_data,
-                                fb_node=fb_graph_node,
-                                parent_id=item_id,
-                            )
+                        yield from self._iter_batch_responses(responses, row_config)
                         return  # Batch processing successful, exit the function.
 
                 except HTTPError as e:
@@ -410,11 +764,10 @@ class FacebookClient:
         # If batch processing was not attempted, was skipped (insights), or failed with a token error,
         # proceed with individual requests for all accounts.
         if ids_str := row_config.query.ids:
-            selected_ids = {id for id in ids_str.split(",")}
-            accounts = [account for account in accounts if account.id in selected_ids]
+            accounts = self._select_accounts(accounts, ids_str)
 
         # Resolve tokens
-        user_token = self.oauth.data.get("access_token")
+        user_token = self._user_token
         if self._request_require_page_token(row_config):
             logger.debug("Require page token")
             is_page_token = True
@@ -428,60 +781,101 @@ class FacebookClient:
             is_page_token = False
             page_tokens = {account.id: user_token for account in accounts}
 
-        for page_id, token in page_tokens.items():
-            page_id = str(page_id)
-
-            try:
-                # Create new client with page token
-                # Use the shared client and pass token in params
-                page_loader = PageLoader(self.client, row_config.type, self.api_version)
-                output_parser = OutputParser(page_loader, page_id, row_config, self.v1_compatibility)
-
-                # Construct Facebook Graph node path
-                fb_graph_node = self._get_fb_graph_node(is_page_token, row_config)
-
-                # Load data from Facebook API
-                page_data = page_loader.load_page(row_config.query, page_id, params={"access_token": token})
-                page_content = self._extract_page_content(row_config.query.path, page_data)
+        # Invariant for the whole query — resolve once instead of per object.
+        token_graph_node = self._get_fb_graph_node(is_page_token, row_config)
+        user_graph_node = self._get_fb_graph_node(False, row_config) if is_page_token else token_graph_node
+        query_name = getattr(row_config, "name", None) or getattr(getattr(row_config, "query", None), "path", "?")
+        # Shared across objects; tokens are passed per request in params
+        page_loader = PageLoader(self.client, row_config.type, self.api_version)
+
+        # First pages are independent requests: load them on a bounded pool, in order and at most
+        # _SYNC_FIRST_PAGE_WORKERS objects ahead, while pagination and parsing stay serial here.
+        objects = iter(page_tokens.items())
+        executor = ThreadPoolExecutor(max_workers=_SYNC_FIRST_PAGE_WORKERS)
+
+        def submit_next(pending: deque) -> None:
+            item = next(objects, None)
+            if item is not None:
+                page_id, token = str(item[0]), item[1]
+                future = executor.submit(
+                    self._load_first_page,
+                    page_loader,
+                    row_config,
+                    page_id,
+                    token,
+                    is_page_token,
+                    token_graph_node,
+                    user_graph_node,
+                )
+                pending.append((page_id, future))
 
-            except Exception as e:
-                if is_page_token and str(e).startswith("400"):
-                    logger.debug(f"Page token failed for {page_id}, trying user token")
-                    try:
-                        # Fallback to user token
-                        page_loader = PageLoader(self.client, row_config.type, self.api_version)
-                        output_parser = OutputParser(page_loader, page_id, row_config, self.v1_compatibility)
-                        fb_graph_node = self._get_fb_graph_node(False, row_config)
-                        page_data = page_loader.load_page(row_config.query, page_id, params=self._with_token({}))
-                        page_content = self._extract_page_content(row_config.query.path, page_data)
-                    except Exception as user_token_error:
-                        logger.debug(f"User token also failed for {page_id}: {str(user_token_error)}")
-                        continue
-                else:
+        try:
+            pending: deque = deque()
+            for _ in range(_SYNC_FIRST_PAGE_WORKERS):
+                submit_next(pending)
+            while pending:
+                page_id, future = pending.popleft()
+                submit_next(pending)
+                try:
+                    loaded = future.result()
+                except CircuitOpenError:
+                    raise
+                except Exception as e:
                     logger.error(f"Failed to load data for {page_id}: {str(e)}")
+                    self.skipped_objects += 1
+                    continue
+                if loaded is None:
                     continue
+                fb_graph_node, page_data = loaded
+                output_parser = OutputParser(page_loader, page_id, row_config, self.v1_compatibility)
 
-            if not page_content:
-                continue
+                # Pagination/parsing happens lazily here. A failure on one object's nested
+                # pagination (e.g. Facebook code=2 on a deep insights paging.next that outlives
+                # the transient-retry budget) must not kill the whole extraction with an opaque
+                # "Internal Server Error" — log it with full context and move on to the next object.
+                try:
+                    yield from output_parser.iter_parsed_data(page_data, fb_graph_node, page_id)
+                except _CONTAINED_OBJECT_ERRORS as e:
+                    # Contain transient/API failures for this one object; UserException
+                    # (user-actionable) and programming errors deliberately propagate.
+                    logger.error(
+                        f"Skipping query '{query_name}' for object {page_id} after errors: {type(e).__name__}: {e}"
+                    )
+                    self.skipped_objects += 1
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _load_first_page(
+        self,
+        page_loader: PageLoader,
+        row_config: QueryRow,
+        page_id: str,
+        token: str,
+        is_page_token: bool,
+        token_graph_node: str,
+        user_graph_node: str,
+    ) -> tuple[str, dict[str, Any]] | None:
+        """Load an object's first page; return (fb_graph_node, page_data), or None when it has no data.
+
+        A rejected page token (400) is retried once with the user token; any other failure is
+        raised for the caller to count. Runs on a worker thread.
+        """
+        try:
+            page_data = page_loader.load_page(row_config.query, page_id, params={"access_token": token})
+            fb_graph_node = token_graph_node
+        except Exception as e:
+            if not (is_page_token and str(e).startswith("400")):
+                raise
+            logger.debug(f"Page token failed for {page_id}, trying user token")
+            page_data = page_loader.load_page(row_config.query, page_id, params=self._with_token_inplace({}))
+            fb_graph_node = user_graph_node
 
-            # Pagination/parsing happens lazily here. A failure on one object's nested
-            # pagination (e.g. Facebook code=2 on a deep insights paging.next that outlives
-            # the transient-retry budget) must not kill the whole extraction with an opaque
-            # "Internal Server Error" — log it with full context and move on to the next object.
-            query_name = getattr(row_config, "name", None) or getattr(getattr(row_config, "query", None), "path", "?")
-            try:
-                yield from output_parser.iter_parsed_data(page_data, fb_graph_node, page_id)
-            except _CONTAINED_OBJECT_ERRORS as e:
-                # Contain transient/API failures for this one object; UserException
-                # (user-actionable) and programming errors deliberately propagate.
-                logger.error(
-                    f"Skipping query '{query_name}' for object {page_id} after errors: {type(e).__name__}: {e}"
-                )
-                self.skipped_objects += 1
-                continue
+        if not self._extract_page_content(row_config.query.path, page_data):
+            return None
+        return fb_graph_node, page_data
 
     def get_accounts(self, url_path: str, fields: str | None) -> list[dict[str, Any]]:
-        params = {}
+        params = self._with_token_inplace({})
         if fields:
             params["fields"] = fields
 
@@ -490,10 +884,7 @@ class FacebookClient:
             endpoint_path = f"/{self.api_version}/{url_path}"
 
             while endpoint_path:
-                response = self.client.get(
-                    endpoint_path=endpoint_path,
-                    params=self._with_token(params),
-                )
+                response = self.client.get(endpoint_path=endpoint_path, params=params)
 
                 if not response:
                     break
@@ -516,7 +907,7 @@ class FacebookClient:
         try:
             response = self.client.get(
                 endpoint_path=f"/{self.api_version}/{account_id}",
-                params=self._with_token({"fields": fields}),
+                params=self._with_token_inplace({"fields": fields}),
             )
             return response
         except Exception as e:
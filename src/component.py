@@ -1,5 +1,7 @@
 import logging
-from dataclasses import dataclass
+import queue
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -9,7 +11,7 @@ from keboola.component.exceptions import UserException
 from keboola.csvwriter import ElasticDictWriter
 from keboola.vcr import DefaultSanitizer, ResponseUrlSanitizer
 
-from client import FacebookClient
+from client import FacebookClient, install_access_token_filter
 from configuration import Configuration
 
 VCR_SANITIZERS = [
@@ -130,16 +132,32 @@ PRIMARY_KEY_CANDIDATES = [
     "reviewer_id",
 ]
 
+# Membership sets for the ordered lists above, so per-table lookups are one set intersection.
+_PREFERRED_COLUMNS_SET = frozenset(PREFERRED_COLUMNS_ORDER)
+_PRIMARY_KEY_CANDIDATES_SET = frozenset(PRIMARY_KEY_CANDIDATES)
+
+
+# Row batches buffered per table before the query generator blocks on its writer thread. A batch
+# holds up to OutputParser.DEFAULT_STREAM_ROW_THRESHOLD rows, so this keeps the CFTL-473 memory
+# bound at a couple of batches per table while still overlapping writes with API calls.
+_WRITER_QUEUE_MAXSIZE = 2
+
 
 @dataclass
 class WriterCacheRecord:
     writer: ElasticDictWriter
     table_definition: TableDefinition
+    # Batches are written by a per-table background thread so CSV I/O overlaps Graph API calls.
+    batches: queue.Queue = field(default_factory=lambda: queue.Queue(maxsize=_WRITER_QUEUE_MAXSIZE))
+    thread: threading.Thread | None = None
+    error: BaseException | None = None
 
 
 class Component(ComponentBase):
     def __init__(self):
         super().__init__()
+        # ComponentBase has just installed its log handlers; make sure they mask tokens.
+        install_access_token_filter()
         self._writer_cache: dict[str, WriterCacheRecord] = {}
         params = self.configuration.parameters
         params["accounts"] = params.get("accounts") or {}
@@ -187,7 +205,8 @@ class Component(ComponentBase):
             for table_name, rows_list in parsed_data.items():
                 if not rows_list:
                     continue
-                primary_key = self._get_primary_key(rows_list)
+                # The primary key is only used when a table's writer is created from its first batch.
+                primary_key = [] if table_name in self._writer_cache else self._get_primary_key(rows_list)
                 self._write_rows(table_name, rows_list, primary_key, True)
                 logger.debug(f"Wrote batch of {len(rows_list)} rows to table {table_name}")
 
@@ -198,6 +217,12 @@ class Component(ComponentBase):
             )
 
     def _finalize_tables(self) -> None:
+        for cache_record in self._writer_cache.values():
+            cache_record.batches.put(None)
+        for cache_record in self._writer_cache.values():
+            cache_record.thread.join()
+            if cache_record.error:
+                raise cache_record.error
         for cache_record in self._writer_cache.values():
             cache_record.writer.writeheader()
             cache_record.writer.close()
@@ -216,9 +241,23 @@ class Component(ComponentBase):
         if table_name not in self._writer_cache:
             self._create_cached_writer(table_name, rows, primary_key, incremental)
 
-        writer = self._writer_cache[table_name].writer
-        for row in rows:
-            writer.writerow(row)
+        cache_record = self._writer_cache[table_name]
+        # Surface a failed write (disk, encoding, ...) now, not after the whole extraction.
+        if cache_record.error:
+            raise cache_record.error
+        cache_record.batches.put(rows)
+
+    @staticmethod
+    def _drain_writer_queue(cache_record: WriterCacheRecord) -> None:
+        """Write queued row batches until the ``None`` sentinel; keep draining after an error."""
+        while (rows := cache_record.batches.get()) is not None:
+            try:
+                if not cache_record.error:
+                    cache_record.writer.writerows(rows)
+            except Exception as e:
+                cache_record.error = e
+            finally:
+                cache_record.batches.task_done()
 
     def _create_cached_writer(
         self,
@@ -228,13 +267,11 @@ class Component(ComponentBase):
         incremental: bool,
     ) -> None:
         # Build union of all columns across the batch
-        all_columns_set: set[str] = set()
-        for row in rows:
-            all_columns_set.update(row.keys())
+        all_columns_set: set[str] = set().union(*rows)
 
         # Reorder columns based on preferred order, then add remaining sorted
         ordered_columns = [col for col in PREFERRED_COLUMNS_ORDER if col in all_columns_set]
-        remaining_columns = sorted(all_columns_set - set(PREFERRED_COLUMNS_ORDER))
+        remaining_columns = sorted(all_columns_set - _PREFERRED_COLUMNS_SET)
         all_columns = ordered_columns + remaining_columns
 
         logger.debug(f"Creating table definition for {table_name} with destination {self.bucket_id}.{table_name}")
@@ -246,16 +283,20 @@ class Component(ComponentBase):
         )
 
         writer = ElasticDictWriter(table_def.full_path, all_columns)
-        self._writer_cache[table_name] = WriterCacheRecord(writer=writer, table_definition=table_def)
+        cache_record = WriterCacheRecord(writer=writer, table_definition=table_def)
+        cache_record.thread = threading.Thread(
+            target=self._drain_writer_queue, args=(cache_record,), name=f"writer-{table_name}", daemon=True
+        )
+        cache_record.thread.start()
+        self._writer_cache[table_name] = cache_record
 
     def _get_primary_key(self, rows: list[dict[str, Any]]) -> list[str]:
         if not rows:
             return []
         # Union of keys across all rows in the batch
-        available_columns: set[str] = set()
-        for row in rows:
-            available_columns.update(row.keys())
-        primary_key = [col for col in PRIMARY_KEY_CANDIDATES if col in available_columns]
+        available_columns: set[str] = set().union(*rows)
+        hits = _PRIMARY_KEY_CANDIDATES_SET & available_columns
+        primary_key = [col for col in PRIMARY_KEY_CANDIDATES if col in hits]
         return primary_key or (["id"] if "id" in available_columns else [])
 
     def _retrieve_bucket_id(self) -> str:
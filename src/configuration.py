@@ -1,9 +1,11 @@
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class QueryConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     path: str | None = ""
     fields: str | None = ""
     ids: str | None = ""
@@ -12,8 +14,18 @@ class QueryConfig(BaseModel):
     until: str | None = ""
     parameters: str | None = None
 
+    @field_validator("ids")
+    @classmethod
+    def _canonicalize_ids(cls, value: str | None) -> str | None:
+        # "a, b," -> "a,b" so ids can be matched against account ids without re-stripping.
+        if not value:
+            return value
+        return ",".join(part.strip() for part in value.split(",") if part.strip())
+
 
 class QueryRow(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     type: str
     name: str
@@ -23,6 +35,8 @@ class QueryRow(BaseModel):
 
 
 class Account(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     account_id: str | None = None
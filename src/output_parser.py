@@ -5,6 +5,17 @@ from typing import Any
 
 from page_loader import resolve_query_window
 
+logger = logging.getLogger(__name__)
+
+# Row keys that alone don't make a row worth writing (see OutputParser._has_meaningful_data).
+_BASIC_IDENTIFIERS = frozenset({"id", "parent_id", "ex_account_id", "fb_graph_node"})
+
+# Distinguishes an absent key from an explicit None in single-lookup dict reads.
+_MISSING = object()
+
+# Action types renamed on output to match the legacy extractor.
+_ACTION_TYPE_RENAMES = {"post_save": "post_reaction"}
+
 
 class OutputParser:
     # Facebook Ads action stats fields that need special handling
@@ -45,10 +56,12 @@ class OutputParser:
     )
 
     # Fields that should be JSON encoded instead of flattened
-    SERIALIZED_LISTS_TYPES = [
-        "issues_info",
-        "frequency_control_specs",
-    ]
+    SERIALIZED_LISTS_TYPES = frozenset(
+        [
+            "issues_info",
+            "frequency_control_specs",
+        ]
+    )
 
     def __init__(self, page_loader, page_id: str, row_config, v1_compatibility: bool = False):
         self.page_loader = page_loader
@@ -59,6 +72,30 @@ class OutputParser:
         # Parsed once; only consulted by _backfill_declared_fields when the flag is on.
         self._declared_fields = self._parse_declared_fields(getattr(row_config, "query", None))
 
+        # Query-level flags are invariant for the parser's lifetime; derive them once
+        # instead of re-stringifying the query for every row and action-stats field.
+        query = getattr(row_config, "query", None)
+        fields_str = str(getattr(query, "fields", "") or "")
+        parameters = getattr(query, "parameters", None)
+        # Action-breakdown mode keys off the first action_breakdowns value only; a breakdown
+        # listed later keeps actions appended to the full insights row.
+        self._action_breakdowns = self._parse_action_breakdowns(parameters)
+        first_action_breakdown = self._action_breakdowns[0] if self._action_breakdowns else None
+        self._is_action_reaction_breakdown = first_action_breakdown == "action_reaction"
+        self._is_action_breakdown = self._is_action_reaction_breakdown or first_action_breakdown == "action_type"
+        self._is_insights_fields = "insights" in fields_str
+        params_str = str(parameters or "")
+        self._query_path = getattr(query, "path", "")
+        self._is_total_value = "metric_type(total_value)" in fields_str or "metric_type=total_value" in params_str
+        self._total_value_window: tuple[str | None, str | None] | None = None
+        self._table_names: dict[str, str] = {}
+        self._action_stats_table_names: dict[str, str] = {}
+        self._row_name = row_config.name
+        is_async = getattr(row_config, "type", None) == "async-insights-query"
+        is_insights_query = fields_str.startswith("insights")
+        # Top-level rows of async and insights queries land in "<row>_insights"
+        self._needs_insights_suffix = (is_async or is_insights_query) and not self._row_name.endswith("_insights")
+
     # Minimum rows buffered before yielding a streaming batch (CFTL-473).
     # Page-sized yields made test suites ~6x slower because every batch pays
     # per-yield overhead in the Component's write loop; accumulating across pages
@@ -92,6 +129,9 @@ class OutputParser:
             raise ValueError("row_threshold must be a positive integer")
         result: dict[str, list[dict[str, Any]]] = {}
         buffered_rows = 0
+        # Invariant for every row of this response, so resolve them once up front.
+        resolved_table_name = self._get_table_name(table_name or self._query_path)
+        base_row = self._create_base_row(fb_node, parent_id)
 
         for page_response in self._iter_paginated_responses(response):
             rows = self._extract_rows(page_response)
@@ -99,7 +139,7 @@ class OutputParser:
                 break
 
             for row in rows:
-                self._process_row(row, fb_node, parent_id, table_name, result)
+                self._process_row(row, fb_node, resolved_table_name, base_row, result)
                 buffered_rows = sum(len(v) for v in result.values())
                 if buffered_rows >= threshold:
                     yield result
@@ -118,41 +158,65 @@ class OutputParser:
     ) -> dict[str, list[dict[str, Any]]]:
         """Fully accumulate rows into a single dict (pre-CFTL-473 behavior).
 
-        Kept for recursive nested-field processing, where synchronous accumulation is
-        intentional: nested responses share the outer row's lifetime and must be merged
-        into the page's batch in deterministic order.
+        Nested-field processing uses the same accumulation via ``_parse_into``, writing
+        straight into the enclosing batch: nested responses share the outer row's lifetime
+        and must land in the page's batch in deterministic order.
         """
         result: dict[str, list[dict[str, Any]]] = {}
-        for batch in self.iter_parsed_data(response, fb_node, parent_id, table_name):
-            for k, v in batch.items():
-                if k in result:
-                    result[k].extend(v)
-                else:
-                    result[k] = v
+        self._parse_into(result, response, fb_node, parent_id, table_name)
         return result
 
+    def _parse_into(
+        self,
+        result: dict[str, list[dict[str, Any]]],
+        response: dict,
+        fb_node: str,
+        parent_id: str,
+        table_name: str | None = None,
+    ) -> None:
+        """Parse every page of ``response`` straight into ``result`` (no batching, no merge step)."""
+        resolved_table_name = self._get_table_name(table_name or self._query_path)
+        base_row = self._create_base_row(fb_node, parent_id)
+        if not isinstance(response, dict) or not response:
+            return
+        if not (response.get("paging") or {}).get("next"):
+            # Single page, the usual case for nested fields: skip the pagination generator
+            for row in self._extract_rows(response):
+                self._process_row(row, fb_node, resolved_table_name, base_row, result)
+            return
+        for page_response in self._iter_paginated_responses(response):
+            rows = self._extract_rows(page_response)
+            if not rows:
+                break
+            for row in rows:
+                self._process_row(row, fb_node, resolved_table_name, base_row, result)
+
     def _iter_paginated_responses(self, response: dict[str, Any]) -> Iterator[dict[str, Any]]:
         """Yield the current response and any subsequent paginated responses."""
         current = response or {}
-        current_url = None
+        # Every URL already followed; catches A -> B -> A cycles, not just a repeated next link
+        visited_urls: set[str] = set()
 
         while isinstance(current, dict) and current:
             yield current
 
             paging = current.get("paging") or {}
             next_url = paging.get("next")
-            if not next_url or next_url == current_url:
+            if not next_url or next_url in visited_urls:
                 break
 
-            logging.debug(f"Following pagination URL: {next_url}")
-            current_url = next_url
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Following pagination URL: {next_url}")
+            visited_urls.add(next_url)
             current = self.page_loader.load_page_from_url(next_url)
 
     def _extract_rows(self, response: dict[str, Any]) -> list[dict[str, Any]]:
         """Normalize response payload into a list of rows to process."""
-        data = response.get("insights", response).get("data")
+        insights = response.get("insights")
+        data = (response if insights is None else insights).get("data")
 
-        if not data and isinstance(response, dict) and "id" in response:
+        # _iter_paginated_responses only yields non-empty dicts
+        if not data and "id" in response:
             return [response]
 
         return data or []
@@ -161,55 +225,51 @@ class OutputParser:
         self,
         row: dict[str, Any],
         fb_graph_node: str,
-        parent_id: str,
-        table_name: str | None,
+        table_name: str,
+        base_row: dict[str, Any],
         result: dict[str, list[dict[str, Any]]],
     ) -> None:
-        """Process a single row from the API response."""
-        table_name = self._get_table_name(table_name or getattr(self.row_config.query, "path", ""))
+        """Process a single row from the API response into the already-resolved ``table_name``.
+
+        ``base_row`` holds the metadata shared by every row of the response; it is never mutated.
+        """
 
         # CFTL-630: backfill fields the user requested but FB omitted for this period,
         # so Storage loads don't fail with "Missing columns: ...". Opt-in only.
         if self.v1_compatibility:
             row = self._backfill_declared_fields(row)
 
-        # Create base row with metadata
-        base_row = self._create_base_row(fb_graph_node, parent_id)
-
         # Process all fields and extract special data types
-        processed_data = self._process_fields(row)
+        regular_fields, nested_tables, action_stats, values = self._process_fields(row)
 
-        # Combine base row with regular fields
-        full_row_data = {**base_row, **processed_data["regular_fields"]}
+        # Combine base row metadata with regular fields
+        full_row_data = {**base_row, **regular_fields}
 
         # Check if this is an action breakdown query (action_reaction or action_type)
-        is_action_breakdown_query = hasattr(self.row_config.query, "parameters") and (
-            "action_breakdowns=action_reaction" in str(self.row_config.query.parameters)
-            or "action_breakdowns=action_type" in str(self.row_config.query.parameters)
-        )
+        is_action_breakdown_query = self._is_action_breakdown
 
         # For action breakdown queries, only create main row if there are no action stats to process
         # Otherwise, actions become the main rows
-        if not is_action_breakdown_query or not processed_data["action_stats"]:
+        if not is_action_breakdown_query or not action_stats:
             # For normal queries (not action breakdown), include action stats in main table
-            if not is_action_breakdown_query and processed_data["action_stats"]:
+            if not is_action_breakdown_query and action_stats:
                 # Process action stats as main table rows
-                self._add_action_stats_to_main_table(result, table_name, full_row_data, processed_data["action_stats"])
+                self._add_action_stats_to_main_table(result, table_name, full_row_data, action_stats)
             else:
                 # Always create the main row (even if it has action stats)
                 # This matches the original behavior where both main and action rows are created
-                if processed_data["values"]:
-                    self._add_value_rows(result, table_name, full_row_data, processed_data["values"])
+                if values:
+                    self._add_value_rows(result, table_name, full_row_data, values)
                 else:
                     # Always add the main row, even if it only has basic fields
                     self._add_row(result, table_name, full_row_data)
 
         # Process action stats as separate tables (only for action breakdown queries)
         if is_action_breakdown_query:
-            self._process_action_stats(processed_data["action_stats"], row, fb_graph_node, result)
+            self._process_action_stats(action_stats, row, fb_graph_node, result)
 
         # Process nested tables recursively — resolved synchronously into the current batch.
-        self._process_nested_data(processed_data["nested_tables"], row, fb_graph_node, result)
+        self._process_nested_data(nested_tables, row, fb_graph_node, result)
 
     def _backfill_declared_fields(self, row: dict[str, Any]) -> dict[str, Any]:
         """Return a row containing every field the user declared in the query.
@@ -229,6 +289,20 @@ class OutputParser:
             filled[field] = ""
         return filled
 
+    @staticmethod
+    def _parse_action_breakdowns(parameters: str | None) -> tuple[str, ...]:
+        """Return the ``action_breakdowns`` values from the query parameters, in configured order."""
+        if not isinstance(parameters, str):
+            return ()
+        value = None
+        for pair in parameters.split("&"):
+            name, sep, raw = pair.partition("=")
+            if sep and name.strip() == "action_breakdowns":
+                value = raw
+        if value is None:
+            return ()
+        return tuple(v.strip() for v in value.split(",") if v.strip())
+
     @classmethod
     def _parse_declared_fields(cls, query) -> list[str]:
         """Return the explicit field list the user declared in the query config.
@@ -347,63 +421,66 @@ class OutputParser:
         # the requested window. Scoped to total_value to avoid adding columns to existing
         # time-series insights schemas (which carry end_time in each values[] entry).
         # Covers both DSL form .metric_type(total_value) and URL form metric_type=total_value.
-        query_config = getattr(self.row_config, "query", None)
-        if query_config is not None:
-            query_fields = str(getattr(query_config, "fields", "") or "")
-            query_parameters = str(getattr(query_config, "parameters", "") or "")
-            is_total_value = "metric_type(total_value)" in query_fields or "metric_type=total_value" in query_parameters
-            if is_total_value:
-                since, until = resolve_query_window(query_config)
-                if since:
-                    base["date_start"] = since
-                if until:
-                    base["date_stop"] = until
+        if self._is_total_value:
+            if self._total_value_window is None:
+                self._total_value_window = resolve_query_window(self.row_config.query)
+            since, until = self._total_value_window
+            if since:
+                base["date_start"] = since
+            if until:
+                base["date_stop"] = until
 
         return base
 
-    def _process_fields(self, row: dict[str, Any]) -> dict[str, Any]:
-        """Process all fields in a row and categorize them."""
-        processed = {
-            "regular_fields": {},
-            "nested_tables": {},
-            "action_stats": {},
-            "values": None,
-        }
+    def _process_fields(
+        self, row: dict[str, Any]
+    ) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any], list[dict[str, Any]] | None]:
+        """Process all fields in a row and categorize them.
+
+        Returns ``(regular_fields, nested_tables, action_stats, values)``.
+        """
+        regular_fields: dict[str, Any] = {}
+        nested_tables: dict[str, Any] = {}
+        action_stats: dict[str, Any] = {}
+        values = None
+        # Locals keep the per-key dispatch free of attribute lookups on wide Ads rows.
+        action_stats_keys = self.ADS_ACTION_STATS_ROW
+        serialized_keys = self.SERIALIZED_LISTS_TYPES
+        flatten = self._flatten_array
 
         for key, value in row.items():
             if key == "values":
-                processed["values"] = value
-            elif isinstance(value, dict) and "data" in value:
-                processed["nested_tables"][key] = value
-                # Also check if this nested object has summary alongside data
-                if "summary" in value:
-                    fake_nested = {"data": [value["summary"]]}
-                    processed["nested_tables"]["summary"] = fake_nested
-            elif isinstance(value, dict) and "summary" in value:
-                fake_nested = {"data": [value["summary"]]}
-                processed["nested_tables"]["summary"] = fake_nested
-            elif key in self.ADS_ACTION_STATS_ROW and isinstance(value, list):
-                # Handle Facebook Ads action stats as separate table
-                processed["action_stats"][key] = value
+                values = value
+                continue
+
+            # Decoded JSON only ever yields plain dict/list, so an exact type check suffices
+            value_type = type(value)
+            if value_type is dict:
+                has_data = "data" in value
+                has_summary = "summary" in value
+                if has_data or has_summary:
+                    if has_data:
+                        nested_tables[key] = value
+                    # A summary (with or without data alongside it) becomes its own nested table
+                    if has_summary:
+                        nested_tables["summary"] = {"data": [value["summary"]]}
+                elif key in serialized_keys:
+                    # Fields that should be JSON encoded instead of flattened
+                    regular_fields[key] = json.dumps(value)
+                else:
+                    flatten(key, value, regular_fields)
+            elif key in serialized_keys:
+                regular_fields[key] = json.dumps(value)
+            elif value_type is list:
+                if key in action_stats_keys:
+                    # Handle Facebook Ads action stats as separate table
+                    action_stats[key] = value
+                else:
+                    flatten(key, value, regular_fields)
             else:
-                # Process regular field based on its type and key
-                processed_field = self._process_single_field(key, value)
-                processed["regular_fields"].update(processed_field)
-
-        return processed
-
-    def _process_single_field(self, key: str, value: Any) -> dict[str, Any]:
-        """Process a single field based on its type and special handling rules."""
-        if key in self.SERIALIZED_LISTS_TYPES:
-            return {key: json.dumps(value)}
-        elif key in self.ADS_ACTION_STATS_ROW and isinstance(value, list):
-            # Handle Facebook Ads action stats fields - these should create separate table entries
-            # Return empty dict for regular fields since these will be processed as separate tables
-            return {}
-        elif isinstance(value, dict | list):
-            return self._flatten_array(key, value)
-        else:
-            return {key: value}
+                regular_fields[key] = value
+
+        return regular_fields, nested_tables, action_stats, values
 
     def _add_value_rows(
         self,
@@ -415,28 +492,28 @@ class OutputParser:
         """Add multiple rows from values array."""
         for value_data in values:
             # Skip values without meaningful content
-            if not self._has_meaningful_value(value_data):
+            value = value_data.get("value")
+            if value is None or value == "":
                 continue
 
-            row = self._create_value_row(full_row_data, value_data)
+            row = self._create_value_row(full_row_data, value_data, value)
             self._add_row(result, table_name, row)
 
-    def _create_value_row(self, base_row: dict[str, Any], value_data: dict[str, Any]) -> dict[str, Any]:
+    def _create_value_row(self, base_row: dict[str, Any], value_data: dict[str, Any], value: Any) -> dict[str, Any]:
         """Create a row from value data.
 
         Supports the new Facebook API breakdown format where breakdown fields
         appear as siblings of 'value' and 'end_time' in the values array entry.
         These sibling breakdown fields are extracted and mapped to key1/key2.
         """
-        row = base_row.copy()
         breakdown_fields = self._extract_breakdown_fields(value_data)
         breakdown_keys = sorted(breakdown_fields.keys())
         key1 = breakdown_fields[breakdown_keys[0]] if len(breakdown_keys) > 0 else ""
         key2 = breakdown_fields[breakdown_keys[1]] if len(breakdown_keys) > 1 else ""
-        row.update({"key1": key1, "key2": key2, "value": value_data["value"]})
+        row = {**base_row, "key1": key1, "key2": key2, "value": value}
 
         # Handle end_time for backward compatibility
-        if hasattr(self.row_config.query, "fields") and "insights" in str(self.row_config.query.fields):
+        if self._is_insights_fields:
             row["end_time"] = value_data.get("end_time", None)
         elif "end_time" in value_data:
             row["end_time"] = value_data["end_time"]
@@ -453,10 +530,6 @@ class OutputParser:
         known_keys = {"value", "end_time"}
         return {k: str(v) for k, v in value_data.items() if k not in known_keys}
 
-    def _has_meaningful_value(self, value_data: dict[str, Any]) -> bool:
-        """Check if value data contains meaningful content."""
-        return "value" in value_data and value_data["value"] is not None and value_data["value"] != ""
-
     def _add_row(
         self,
         result: dict[str, list[dict[str, Any]]],
@@ -467,9 +540,7 @@ class OutputParser:
         if not self._has_meaningful_data(row_data):
             return
 
-        if table_name not in result:
-            result[table_name] = []
-        result[table_name].append(row_data)
+        result.setdefault(table_name, []).append(row_data)
 
     def _add_action_stats_to_main_table(
         self,
@@ -479,6 +550,8 @@ class OutputParser:
         action_stats: dict[str, Any],
     ) -> None:
         """Add action stats rows to main table (like old implementation)."""
+        has_meaningful_data = self._has_meaningful_data
+        rows = None
         for stats_field_name, stats_data in action_stats.items():
             if not isinstance(stats_data, list):
                 continue
@@ -487,40 +560,37 @@ class OutputParser:
                 if not isinstance(action, dict):
                     continue
 
+                # Process action_type (same rename as _build_action_row, plus prefix stripping)
+                action_type = action.get("action_type", "").rpartition(".")[2]
+                action_type = _ACTION_TYPE_RENAMES.get(action_type, action_type)
+
                 # Create row with action data (similar to old implementation)
-                action_row = base_row.copy()
-
-                # Process action_type (same logic as _populate_action_row)
-                raw_action_type = action.get("action_type", "")
-                action_type = raw_action_type.split(".")[-1]
-                if action_type == "post_save":
-                    action_type = "post_reaction"
-
-                action_row.update(
-                    {
-                        "ads_action_name": stats_field_name,
-                        "action_type": action_type,
-                        "value": action.get("value", ""),
-                    }
-                )
+                action_row = {
+                    **base_row,
+                    "ads_action_name": stats_field_name,
+                    "action_type": action_type,
+                    "value": action.get("value", ""),
+                }
 
                 # Add all other fields from action (except the ones we already handled)
                 for key, value in action.items():
-                    if key not in ["action_type", "value"]:
+                    if key not in ("action_type", "value"):
                         action_row[key] = value
 
-                self._add_row(result, table_name, action_row)
+                if has_meaningful_data(action_row):
+                    # Resolve the target list lazily so action-less rows never create an empty table
+                    if rows is None:
+                        rows = result.setdefault(table_name, [])
+                    rows.append(action_row)
 
     def _has_meaningful_data(self, row_data: dict[str, Any]) -> bool:
         """Check if row contains meaningful data beyond basic identifiers."""
-        basic_identifiers = {"id", "parent_id", "ex_account_id", "fb_graph_node"}
-
         # If we have any data beyond just the basic identifiers, it's meaningful
-        has_additional_data = any(
-            key not in basic_identifiers and value is not None and value != "" for key, value in row_data.items()
-        )
-
-        return has_additional_data
+        for key, value in row_data.items():
+            if key in _BASIC_IDENTIFIERS or value is None or value == "":
+                continue
+            return True
+        return False
 
     def _process_action_stats(
         self,
@@ -530,13 +600,13 @@ class OutputParser:
         result: dict[str, list[dict[str, Any]]],
     ) -> None:
         """Process action stats as separate tables with _insights suffix or flatten for breakdowns."""
-        is_action_breakdown = hasattr(self.row_config.query, "parameters") and any(
-            b in str(self.row_config.query.parameters)
-            for b in [
-                "action_breakdowns=action_reaction",
-                "action_breakdowns=action_type",
-            ]
-        )
+        is_action_breakdown = self._is_action_breakdown
+
+        # The base row depends only on the originating row, not on the stats field.
+        base_row = self._create_base_row(fb_graph_node, self.page_id)
+        self._copy_common_fields(base_row, original_row, extended=is_action_breakdown)
+        include_reaction = is_action_breakdown and self._is_action_reaction_breakdown
+        reaction_default = original_row.get("action_reaction", "")
 
         for stats_field_name, stats_data in action_stats.items():
             if not isinstance(stats_data, list):
@@ -546,22 +616,28 @@ class OutputParser:
                 self._get_table_name("") if is_action_breakdown else self._get_action_stats_table_name(stats_field_name)
             )
 
-            base_row = self._create_base_row(fb_graph_node, self.page_id)
-            self._copy_common_fields(base_row, original_row, extended=is_action_breakdown)
-
+            # Everything but the action's own fields is shared by all actions of this stats field
+            row_template = {**base_row, "ads_action_name": stats_field_name}
+            rows = None
             for action in stats_data:
                 if not isinstance(action, dict):
                     continue
-
-                action_row = base_row.copy()
-                self._populate_action_row(
-                    action_row,
-                    action,
-                    stats_field_name,
-                    original_row,
-                    is_action_breakdown,
-                )
-                self._add_row(result, table_name, action_row)
+                action_row = self._build_action_row(row_template, action, include_reaction, reaction_default)
+                if self._has_meaningful_data(action_row):
+                    if rows is None:
+                        rows = result.setdefault(table_name, [])
+                    rows.append(action_row)
+
+    _COMMON_FIELDS = (
+        "account_id",
+        "ad_id",
+        "adset_id",
+        "campaign_id",
+        "date_start",
+        "date_stop",
+        "publisher_platform",
+    )
+    _EXTENDED_COMMON_FIELDS = (*_COMMON_FIELDS, "account_name", "campaign_name")
 
     def _copy_common_fields(self, base_row: dict, original_row: dict, extended: bool) -> None:
         """Copy fields from the originating insights row onto a per-action row.
@@ -570,7 +646,7 @@ class OutputParser:
         every scalar field from the originating row — true V1 parity, so metric columns
         the user requested (``ad_name``, ``impressions``, ``clicks``, ``spend``,
         ``reach``, …) flow through instead of being silently dropped (CFTL-630). Nested
-        action-stat arrays/dicts are skipped — they are unpacked by ``_populate_action_row``.
+        action-stat arrays/dicts are skipped — they are unpacked by ``_build_action_row``.
         Off (default) keeps the narrow 0.0.17 list so existing output is unchanged.
         """
         if extended and self.v1_compatibility:
@@ -580,57 +656,43 @@ class OutputParser:
                 base_row[key] = value
             return
 
-        fields = [
-            "account_id",
-            "ad_id",
-            "adset_id",
-            "campaign_id",
-            "date_start",
-            "date_stop",
-            "publisher_platform",
-        ]
-        if extended:
-            fields += ["account_name", "campaign_name"]
-
+        fields = self._EXTENDED_COMMON_FIELDS if extended else self._COMMON_FIELDS
         for field in fields:
-            if field in original_row:
-                base_row[field] = original_row[field]
+            value = original_row.get(field, _MISSING)
+            if value is not _MISSING:
+                base_row[field] = value
 
-    def _populate_action_row(
-        self,
-        action_row: dict,
-        action: dict,
-        stats_field_name: str,
-        original_row: dict,
-        is_action_breakdown: bool,
-    ) -> None:
+    @staticmethod
+    def _build_action_row(row_template: dict, action: dict, include_reaction: bool, reaction_default: Any) -> dict:
         action_type = action.get("action_type", "")
-        if action_type == "post_save":
-            action_type = "post_reaction"
+        action_type = _ACTION_TYPE_RENAMES.get(action_type, action_type)
 
-        action_row.update(
-            {
-                "ads_action_name": stats_field_name,
-                "action_type": action_type,
-                "value": action.get("value", ""),
-            }
-        )
+        action_row = {
+            **row_template,
+            "action_type": action_type,
+            "value": action.get("value", ""),
+        }
 
-        if is_action_breakdown and "action_breakdowns=action_reaction" in str(self.row_config.query.parameters):
-            action_reaction = action.get("action_reaction", original_row.get("action_reaction", ""))
-            action_row["action_reaction"] = action_reaction
+        if include_reaction:
+            action_row["action_reaction"] = action.get("action_reaction", reaction_default)
 
         for key, value in action.items():
-            if key not in ["action_type", "value", "action_reaction"]:
+            if key not in ("action_type", "value", "action_reaction"):
                 action_row[key] = value
+        return action_row
 
     def _get_action_stats_table_name(self, stats_field_name: str) -> str:
-        """Get the proper table name for action stats based on Clojure logic."""
+        """Get the proper table name for action stats based on Clojure logic. Memoized per parser."""
+        if (cached := self._action_stats_table_names.get(stats_field_name)) is not None:
+            return cached
         # Check if the query name already ends with the stats field name
-        if self.row_config.name.endswith(f"_{stats_field_name}"):
-            return f"{self.row_config.name}_insights"
+        if self._row_name.endswith(f"_{stats_field_name}"):
+            final_name = f"{self._row_name}_insights"
         else:
-            return f"{self.row_config.name}_{stats_field_name}_insights"
+            final_name = f"{self._row_name}_{stats_field_name}_insights"
+
+        self._action_stats_table_names[stats_field_name] = final_name
+        return final_name
 
     def _process_nested_data(self, nested_tables: dict, original_row: dict, fb_graph_node: str, result: dict) -> None:
         """Process nested table data recursively into the current batch."""
@@ -638,52 +700,61 @@ class OutputParser:
             nested_graph_node = f"{fb_graph_node}_{table_name}"
             nested_row_id = original_row.get("id")
 
-            nested_result = self.parse_data(table_data, nested_graph_node, nested_row_id, table_name)
+            self._parse_into(result, table_data, nested_graph_node, nested_row_id, table_name)
 
-            # Merge nested results
-            for nested_table, nested_rows in nested_result.items():
-                if nested_table not in result:
-                    result[nested_table] = []
-                result[nested_table].extend(nested_rows)
-
-    def _flatten_array(self, parent_key: str, values: Any) -> dict[str, Any]:
+    def _flatten_array(self, parent_key: str, values: Any, out: dict[str, Any] | None = None) -> dict[str, Any]:
         """
         Flatten arrays and objects into key-value pairs.
+
+        Pairs are written into ``out`` when given (and returned), so callers can flatten
+        straight into a row without merging an intermediate dict.
         """
-        result = {}
+        result = {} if out is None else out
 
+        # Fast path for the common shallow case: a dict/list whose members are all leaves.
         if isinstance(values, dict):
-            for k, v in values.items():
-                nested = self._flatten_array(f"{parent_key}_{k}", v)
-                result.update(nested)
+            if not any(isinstance(v, dict | list) for v in values.values()):
+                for k, v in values.items():
+                    result[f"{parent_key}_{k}"] = v
+                return result
         elif isinstance(values, list):
-            for i, v in enumerate(values):
-                nested = self._flatten_array(f"{parent_key}_{i}", v)
-                result.update(nested)
-        else:
-            result[parent_key] = values
+            if not any(isinstance(v, dict | list) for v in values):
+                for i, v in enumerate(values):
+                    result[f"{parent_key}_{i}"] = v
+                return result
+
+        # Explicit stack instead of recursion; children are pushed in reverse so leaves are
+        # emitted in the same depth-first order the recursive version produced.
+        stack = [(parent_key, values)]
+        while stack:
+            key, value = stack.pop()
+            if isinstance(value, dict):
+                stack.extend((f"{key}_{k}", v) for k, v in reversed(value.items()))
+            elif isinstance(value, list):
+                stack.extend((f"{key}_{i}", value[i]) for i in range(len(value) - 1, -1, -1))
+            else:
+                result[key] = value
 
         return result
 
     def _get_table_name(self, table_name: str) -> str:
         """
         Determine the final table name based on row configuration and query context,
-        following Clojure-inspired logic.
+        following Clojure-inspired logic. Results are memoized per parser.
         """
-        row_name = self.row_config.name
-        is_async = hasattr(self.row_config, "type") and self.row_config.type == "async-insights-query"
-
-        # Check if this is an insights query by examining the fields
-        is_insights_query = str(getattr(self.row_config.query, "fields", "")).startswith("insights")
-
+        if (cached := self._table_names.get(table_name)) is not None:
+            return cached
+        row_name = self._row_name
         final_name = row_name
 
         if not table_name:
             # For both async insights queries and nested insights queries, add _insights suffix
-            if (is_async or is_insights_query) and not row_name.endswith("_insights"):
+            if self._needs_insights_suffix:
                 final_name = f"{row_name}_insights"
         else:
-            if table_name not in row_name and not row_name.endswith(f"_{table_name}"):
-                final_name = f"{row_name}_{table_name}"
+            suffix = "_" + table_name
+            if table_name not in row_name and not row_name.endswith(suffix):
+                final_name = row_name + suffix
 
+        self._table_names[table_name] = final_name
         return final_name
@@ -1,11 +1,14 @@
+import functools
 import logging
+import random
 import re
+import threading
 import time
 from dataclasses import dataclass
-from datetime import UTC, datetime
 from typing import Any
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import unquote_plus, urlparse
 
+import orjson
 from keboola.component.exceptions import UserException
 from keboola.http_client import HttpClient
 from keboola.utils.date import get_past_date
@@ -65,6 +68,10 @@ DSL_SIMPLE_PARAMS = [
     "time_range",
     "time_ranges",
 ]
+_DSL_KNOWN_PARAMS = frozenset(DSL_SIMPLE_PARAMS) | {"metric", "since", "until"}
+# ".name(args)" calls in an insights fields string, and bare ".name(" openings for the unknown-param warning
+_DSL_CALL_RE = re.compile(r"\.([a-zA-Z_]+)\(([^)]*)\)")
+_DSL_CALL_NAME_RE = re.compile(r"\.([a-zA-Z_]+)\(")
 
 INVALID_METRIC_ERROR = FacebookErrorCode(code=100, message_fragment="should be specified with parameter metric_type")
 
@@ -86,6 +93,25 @@ _FB_TRANSIENT_ERROR_CODES = frozenset(
 _FB_TRANSIENT_ERROR_MAX_RETRIES = 5
 _FB_TRANSIENT_ERROR_BACKOFF_BASE = 5  # seconds; delays are 5s, 10s, 20s, 40s, 80s
 
+# Async report polling backs off exponentially with full jitter: short jobs are picked up within
+# a second or two, and concurrent pollers spread out instead of hitting the API in lockstep.
+_ASYNC_POLL_BASE_DELAY = 1.0  # seconds; jitter ceilings are 1s, 2s, 4s, 8s, then 15s
+_ASYNC_POLL_MAX_DELAY = 15.0
+_ASYNC_POLL_NEAR_DONE_DELAY = 2.0  # ceiling once a job reports >= 80% completion
+_ASYNC_POLL_TIMEOUT = 300  # seconds of wall time before a report is treated as stuck
+
+# Terminal async report-run statuses
+_ASYNC_JOB_COMPLETED = "Job Completed"
+_ASYNC_JOB_FAILED_STATUSES = frozenset({"Job Failed", "Job Skipped"})
+
+
+def async_poll_delay(attempt: int, percent_complete: float = 0) -> float:
+    """Return the jittered wait before the next async-report status poll."""
+    delay = random.uniform(0, min(_ASYNC_POLL_MAX_DELAY, _ASYNC_POLL_BASE_DELAY * 2**attempt))
+    if (percent_complete or 0) >= 80:
+        delay = min(delay, _ASYNC_POLL_NEAR_DONE_DELAY)
+    return delay
+
 
 class AsyncInsightsJobTransientError(Exception):
     """Raised when a Facebook async insights report fails transiently (``Job Failed`` /
@@ -94,6 +120,37 @@ class AsyncInsightsJobTransientError(Exception):
     """
 
 
+class AsyncPollCancelled(Exception):
+    """Raised in an async polling worker once its consumer has stopped (e.g. on a parse error)."""
+
+
+def sleep_unless_cancelled(seconds: float, cancel: threading.Event | None = None) -> None:
+    """``time.sleep``, but raise ``AsyncPollCancelled`` as soon as ``cancel`` is set."""
+    if cancel is None:
+        time.sleep(seconds)
+    elif cancel.wait(seconds):
+        raise AsyncPollCancelled()
+
+
+class CircuitOpenError(UserException):
+    """Raised instead of calling the Graph API once repeated outages have opened the circuit.
+
+    It is a ``UserException`` so the run fails fast rather than skipping every remaining object;
+    the broad per-object handlers re-raise it.
+    """
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_past_date(expression: str, utc_hour: str) -> str:
+    # utc_hour is only part of the cache key, so "5 hours ago" and the like roll over correctly.
+    return get_past_date(expression).strftime("%Y-%m-%d")
+
+
+def past_date_str(expression: str) -> str:
+    """``get_past_date(expression)`` as YYYY-MM-DD, memoized per UTC hour (dateparser is slow)."""
+    return _resolve_past_date(expression.strip(), time.strftime("%Y-%m-%dT%H", time.gmtime()))
+
+
 def resolve_query_window(query_config) -> tuple[str | None, str | None]:
     """Return the effective (since, until) YYYY-MM-DD strings that will be sent to the API.
 
@@ -107,9 +164,9 @@ def resolve_query_window(query_config) -> tuple[str | None, str | None]:
     until = None
 
     if getattr(query_config, "since", "").strip():
-        since = get_past_date(query_config.since).strftime("%Y-%m-%d")
+        since = past_date_str(query_config.since)
     if getattr(query_config, "until", "").strip():
-        until = get_past_date(query_config.until).strftime("%Y-%m-%d")
+        until = past_date_str(query_config.until)
 
     fields = str(getattr(query_config, "fields", ""))
     path = getattr(query_config, "path", None) or ""
@@ -117,7 +174,7 @@ def resolve_query_window(query_config) -> tuple[str | None, str | None]:
         for date_param in ("since", "until"):
             match = re.search(rf"\.{date_param}\(([^)]*)\)", fields)
             if match:
-                resolved = get_past_date(match.group(1).strip()).strftime("%Y-%m-%d")
+                resolved = past_date_str(match.group(1))
                 if date_param == "since":
                     since = resolved
                 else:
@@ -127,24 +184,57 @@ def resolve_query_window(query_config) -> tuple[str | None, str | None]:
 
 
 class FacebookErrorHandler:
-    """Handles Facebook API error detection and categorization."""
+    """Handles Facebook API error detection and categorization.
+
+    The public checks accept an optional pre-parsed ``context`` (see ``error_context``) so a
+    caller running several of them on one error parses the response body only once.
+    """
+
+    @staticmethod
+    def error_context(http_error: HTTPError) -> tuple[dict[str, Any], str]:
+        """Parse an error once: the structured FB ``error`` object and the lowercased error text.
+
+        The text combines the response body and the exception message, the two places a
+        ``message_fragment`` may appear.
+        """
+        response = getattr(http_error, "response", None)
+        error_info: dict[str, Any] = {}
+        texts = []
+        if response is not None:
+            try:
+                info = orjson.loads(response.content).get("error", {})
+                error_info = info if isinstance(info, dict) else {}
+            except Exception:
+                pass
+            try:
+                texts.append(response.text.lower())
+            except Exception:
+                pass
+        try:
+            texts.append(str(http_error).lower())
+        except Exception:
+            pass
+        return error_info, "\n".join(texts)
 
     @staticmethod
-    def is_recoverable_error(http_error: HTTPError) -> tuple[bool, str]:
+    def is_recoverable_error(
+        http_error: HTTPError, context: tuple[dict[str, Any], str] | None = None
+    ) -> tuple[bool, str]:
         """
         Check if an HTTP error is recoverable (should return empty data instead of failing).
         Returns (is_recoverable, error_description).
         """
-        if FacebookErrorHandler._matches_error(http_error, BUSINESS_CONVERSION_ERROR):
+        context = context or FacebookErrorHandler.error_context(http_error)
+        if FacebookErrorHandler._matches_error(http_error, BUSINESS_CONVERSION_ERROR, context):
             return True, "Media Posted Before Business Account Conversion"
 
-        if FacebookErrorHandler._matches_error(http_error, DATE_RANGE_LIMIT_ERROR):
+        if FacebookErrorHandler._matches_error(http_error, DATE_RANGE_LIMIT_ERROR, context):
             return (
                 True,
                 "30-day limit exceeded. Change 'since(30 days ago)' to '29 days ago' in config.",
             )
 
-        if FacebookErrorHandler._matches_error(http_error, OBJECT_NOT_FOUND_ERROR):
+        if FacebookErrorHandler._matches_error(http_error, OBJECT_NOT_FOUND_ERROR, context):
             return (
                 True,
                 "Account no longer exists or is inaccessible. Remove it or re-run Add Account.",
@@ -153,16 +243,12 @@ class FacebookErrorHandler:
         return False, ""
 
     @staticmethod
-    def raise_if_user_actionable(http_error: HTTPError) -> None:
+    def raise_if_user_actionable(http_error: HTTPError, context: tuple[dict[str, Any], str] | None = None) -> None:
         """Raise UserException for errors that indicate a misconfiguration in the query."""
-        if FacebookErrorHandler._matches_error(http_error, INVALID_METRIC_ERROR):
-            response = getattr(http_error, "response", None)
-            api_msg = ""
-            if response is not None:
-                try:
-                    api_msg = response.json().get("error", {}).get("message", "").strip()
-                except Exception:
-                    pass
+        context = context or FacebookErrorHandler.error_context(http_error)
+        if FacebookErrorHandler._matches_error(http_error, INVALID_METRIC_ERROR, context):
+            error_info, _ = context
+            api_msg = str(error_info.get("message", "") or "").strip()
             detail = f"Invalid metric configuration: {api_msg}." if api_msg else "Invalid metric configuration."
             raise UserException(
                 f"{detail} "
@@ -174,54 +260,32 @@ class FacebookErrorHandler:
     def is_transient_error(http_error: HTTPError) -> bool:
         """Return True for Facebook error codes documented as transient/retryable."""
         try:
-            code = http_error.response.json().get("error", {}).get("code")
+            code = orjson.loads(http_error.response.content).get("error", {}).get("code")
         except Exception:
             return False
         return code in _FB_TRANSIENT_ERROR_CODES
 
     @staticmethod
-    def _matches_error(http_error: HTTPError, error_code: FacebookErrorCode) -> bool:
+    def _matches_error(
+        http_error: HTTPError, error_code: FacebookErrorCode, context: tuple[dict[str, Any], str] | None = None
+    ) -> bool:
         """Check if HTTP error matches the given error code definition.
 
         When a message_fragment is provided it is REQUIRED to match, even if the code/subcode
         already do. This avoids catching unrelated Facebook errors that happen to share a code
         (e.g. generic code=100 permission errors vs our specific 'metric_type' hint).
         """
-        response = getattr(http_error, "response", None)
-        fragment = (error_code.message_fragment or "").lower()
-
-        # Check code/subcode match from structured JSON error
-        code_matches = False
-        if error_code.code is not None and response is not None:
-            try:
-                error_info = response.json().get("error", {})
-                if error_info.get("code") == error_code.code:
-                    if error_code.subcode is None or error_info.get("error_subcode") == error_code.subcode:
-                        code_matches = True
-            except Exception:
-                pass
-
-        # Check message_fragment match in response text or exception string
-        fragment_matches = False
-        if fragment:
-            if response is not None:
-                try:
-                    if fragment in response.text.lower():
-                        fragment_matches = True
-                except Exception:
-                    pass
-            if not fragment_matches:
-                try:
-                    if fragment in str(http_error).lower():
-                        fragment_matches = True
-                except Exception:
-                    pass
+        error_info, error_text = context or FacebookErrorHandler.error_context(http_error)
 
+        fragment = (error_code.message_fragment or "").lower()
         if fragment:
             # When fragment is defined it is REQUIRED. Code-only match is not enough.
-            return fragment_matches
+            return fragment in error_text
+
         # No fragment defined → fall back to code-based match
-        return code_matches
+        if error_code.code is None or error_info.get("code") != error_code.code:
+            return False
+        return error_code.subcode is None or error_info.get("error_subcode") == error_code.subcode
 
 
 class PaginationHandler:
@@ -233,7 +297,7 @@ class PaginationHandler:
         Check if pagination request should be skipped due to invalid timestamps.
         Returns (should_skip, reason).
         """
-        now_ts = int(datetime.now(UTC).timestamp())
+        now_ts = int(time.time())
         since_ts = PaginationHandler._parse_unix_ts(params.get("since"))
         until_ts = PaginationHandler._parse_unix_ts(params.get("until"))
         one_hour_ago = now_ts - 3600
@@ -258,7 +322,7 @@ class PaginationHandler:
         """Remove future 'until' timestamp if present, return adjusted params."""
         until_ts = PaginationHandler._parse_unix_ts(params.get("until"))
         if until_ts is not None:
-            now_ts = int(datetime.now(UTC).timestamp())
+            now_ts = int(time.time())
             if until_ts > now_ts:
                 logger.debug("Adjusting pagination window to end at current time")
                 params = params.copy()
@@ -270,15 +334,22 @@ class PaginationHandler:
         """Parse a 10-digit Unix timestamp, return None if not valid."""
         if value is None:
             return None
-        s = str(value)
-        return int(s) if s.isdigit() and len(s) == 10 else None
+        try:
+            ts = int(value)
+        except (TypeError, ValueError):
+            return None
+        return ts if 1_000_000_000 <= ts <= 9_999_999_999 else None
 
 
 class PageLoader:
+    __slots__ = ("_params_cache", "api_version", "client", "query_type")
+
     def __init__(self, client: HttpClient, query_type: str, api_version: str = "v20.0"):
         self.client = client
         self.query_type = query_type
         self.api_version = api_version
+        # Query params depend only on the (frozen) query config, not on the object being loaded
+        self._params_cache: dict[Any, dict[str, Any]] = {}
 
     def _get_with_transient_retry(self, path: str, params: dict[str, Any]) -> dict[str, Any] | None:
         """GET request with exponential-backoff retry on documented FB transient errors.
@@ -301,7 +372,7 @@ class PageLoader:
                     raise
         return None  # unreachable — loop always returns or raises
 
-    def load_page(self, query_config, page_id: str, params: dict[str, Any] = None) -> dict[str, Any]:
+    def load_page(self, query_config, page_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         # Async-insights queries are NOT loaded here: FacebookClient runs them via
         # start_async_insights_job + _poll_and_process_async_jobs (parallel start, then poll
         # with re-submit/backoff). load_page is only ever called for sync queries, whose
@@ -313,18 +384,20 @@ class PageLoader:
             )
         return self._load_regular_page(query_config, page_id, params)
 
-    def start_async_insights_job(self, query_config, page_id: str, params: dict = {}) -> str | None:
+    def start_async_insights_job(self, query_config, page_id: str, params: dict | None = None) -> str | None:
         page_id = page_id if page_id.startswith("act_") else f"act_{page_id}"
         endpoint_path = f"/{self.api_version}/{page_id}/insights"
 
         # Build parameters using the same logic as regular page loading
         # This ensures all DSL parameters are properly parsed
         base_params = self._build_params(query_config)
-        base_params.update(params)
+        if params:
+            base_params.update(params)
         params = base_params
 
         logger.info(f"Starting async insights request: {endpoint_path}")
-        logger.debug(f"Async insights params: {params}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Async insights params: {params}")
 
         try:
             response = self.client.post(endpoint_path=endpoint_path, json=params)
@@ -336,17 +409,34 @@ class PageLoader:
             logger.info(f"Async job started successfully with report ID: {report_id}")
             return report_id
 
+        except CircuitOpenError:
+            raise
         except Exception as e:
             logger.error(f"Error starting async insights job: {e}")
             return None
 
-    def poll_async_job(self, report_id: str, access_token: str = None) -> dict[str, Any]:
-        is_finished = False
-        max_attempts = 60  # 5 minutes max wait time
+    def poll_async_job(
+        self,
+        report_id: str,
+        access_token: str = None,
+        deadline: float | None = None,
+        cancel: threading.Event | None = None,
+    ) -> dict[str, Any]:
+        """Poll a report until it completes, then fetch its first result page.
+
+        ``deadline`` (a ``time.monotonic()`` value) defaults to ``_ASYNC_POLL_TIMEOUT`` from now;
+        a report still pending when it passes raises ``AsyncInsightsJobTransientError``. Setting
+        ``cancel`` stops polling with ``AsyncPollCancelled`` before the next request.
+        """
+        # async_status is the source of truth; async_percent_completion can lag behind a completed job
+        if deadline is None:
+            deadline = time.monotonic() + _ASYNC_POLL_TIMEOUT
         attempt = 0
         async_status = ""
 
-        while (not is_finished or async_status != "Job Completed") and attempt < max_attempts:
+        while async_status != _ASYNC_JOB_COMPLETED and time.monotonic() < deadline:
+            if cancel is not None and cancel.is_set():
+                raise AsyncPollCancelled()
             try:
                 # Include access token in polling request
                 params = {"access_token": access_token} if access_token else {}
@@ -361,43 +451,46 @@ class PageLoader:
 
                 logger.info(f"Async job {report_id}: {async_percent}% complete, status: {async_status}")
 
-                is_finished = async_percent == 100
-
-                if async_status in ["Job Failed", "Job Skipped"]:
+                if async_status in _ASYNC_JOB_FAILED_STATUSES:
                     # Transient under load — caller re-submits the report.
                     raise AsyncInsightsJobTransientError(f"async_status={async_status}")
 
-                if not is_finished or async_status != "Job Completed":
-                    time.sleep(5)
+                if async_status != _ASYNC_JOB_COMPLETED:
+                    sleep_unless_cancelled(async_poll_delay(attempt, async_percent), cancel)
                     attempt += 1
 
-            except AsyncInsightsJobTransientError:
+            except (AsyncInsightsJobTransientError, AsyncPollCancelled):
                 raise
             except Exception as e:
                 logger.error(f"Error polling async job {report_id}: {str(e)}")
                 raise e
 
-        if not is_finished or async_status != "Job Completed":
+        if async_status != _ASYNC_JOB_COMPLETED:
             # Did not complete within the poll budget — also transient; let the caller re-submit.
             raise AsyncInsightsJobTransientError(f"report {report_id} did not complete within timeout")
 
-        # Get final results with access token
-        try:
-            params = {"access_token": access_token} if access_token else {}
-            final_response = self.client.get(endpoint_path=f"/{self.api_version}/{report_id}/insights", params=params)
-            return final_response if final_response else {"data": []}
-        except Exception as e:
-            logger.error(f"Failed to get final results for job {report_id}: {str(e)}")
-            return {"data": []}
+        return self.get_async_job_results(report_id, access_token)
 
-    def _load_regular_page(self, query_config, page_id: str, params: dict[str, Any] = None) -> dict[str, Any]:
+    def get_async_job_results(self, report_id: str, access_token: str = None) -> dict[str, Any]:
+        """Fetch the first result page of an async report that is already completed.
+
+        Errors propagate: the client contains them per report (skip + count) instead of the
+        report silently producing no rows.
+        """
+        params = {"access_token": access_token} if access_token else {}
+        final_response = self.client.get(endpoint_path=f"/{self.api_version}/{report_id}/insights", params=params)
+        return final_response if final_response else {"data": []}
+
+    def _load_regular_page(self, query_config, page_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         base_params = self._build_params(query_config)
-        base_params.update(params or {})
+        if params:
+            base_params.update(params)
 
         endpoint_path = self._build_endpoint_path(query_config, page_id)
 
-        logger.debug(f"Loading page data from: {endpoint_path}")
-        logger.debug(f"Request params: {base_params}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Loading page data from: {endpoint_path}")
+            logger.debug(f"Request params: {base_params}")
 
         try:
             response = self._get_with_transient_retry(endpoint_path, base_params)
@@ -405,10 +498,11 @@ class PageLoader:
 
         except HTTPError as e:
             # Raise UserException for misconfigured queries before checking recoverable errors
-            FacebookErrorHandler.raise_if_user_actionable(e)
+            error_context = FacebookErrorHandler.error_context(e)
+            FacebookErrorHandler.raise_if_user_actionable(e, error_context)
 
             # Check for recoverable errors
-            is_recoverable, error_desc = FacebookErrorHandler.is_recoverable_error(e)
+            is_recoverable, error_desc = FacebookErrorHandler.is_recoverable_error(e, error_context)
             if is_recoverable:
                 logger.warning(f"Skipping account: {error_desc}")
                 return {"data": []}
@@ -431,6 +525,16 @@ class PageLoader:
             raise
 
     def _build_params(self, query_config) -> dict[str, Any]:
+        """Return a fresh copy of the request params for ``query_config``, built once per loader."""
+        try:
+            cached = self._params_cache.get(query_config)
+        except TypeError:  # unhashable (non-frozen) config object
+            return self._build_query_params(query_config)
+        if cached is None:
+            cached = self._params_cache[query_config] = self._build_query_params(query_config)
+        return dict(cached)
+
+    def _build_query_params(self, query_config) -> dict[str, Any]:
         params = {
             "limit": query_config.limit,
         }
@@ -447,26 +551,28 @@ class PageLoader:
         if not query_config.path and fields.startswith("insights"):
             # TODO: these regexes could also be used to validate DSL fields in sync actions
             #       (accounts, adaccounts, igaccounts) before a job is run.
+            # Scan every ".name(args)" call once; the first occurrence of a name wins
+            dsl_calls: dict[str, str] = {}
+            for match in _DSL_CALL_RE.finditer(fields):
+                dsl_calls.setdefault(match.group(1), match.group(2))
+
             # Extract simple parameters (just strip the value)
             for param_name in DSL_SIMPLE_PARAMS:
-                match = re.search(rf"\.{param_name}\(([^)]*)\)", fields)
-                if match:
-                    params[param_name] = match.group(1).strip()
+                if param_name in dsl_calls:
+                    params[param_name] = dsl_calls[param_name].strip()
 
             # Extract 'metric' - special handling: split by comma and join
-            match = re.search(r"\.metric\(([^)]*)\)", fields)
-            if match:
-                metrics = [m.strip() for m in match.group(1).replace("\n", "").split(",") if m.strip()]
+            if "metric" in dsl_calls:
+                metrics = [m.strip() for m in dsl_calls["metric"].replace("\n", "").split(",") if m.strip()]
                 if metrics:
                     params["metric"] = ",".join(metrics)
 
             # Warn about unrecognized DSL parameters
-            known_params = set(DSL_SIMPLE_PARAMS) | {"metric", "since", "until"}
-            for unrecognized in re.findall(r"\.([a-zA-Z_]+)\(", fields):
-                if unrecognized not in known_params:
+            for unrecognized in _DSL_CALL_NAME_RE.findall(fields):
+                if unrecognized not in _DSL_KNOWN_PARAMS:
                     logger.warning(
                         f"Unrecognized DSL parameter '.{unrecognized}(...)' in query fields — "
-                        f"it will be ignored. Known parameters: {sorted(known_params)}"
+                        f"it will be ignored. Known parameters: {sorted(_DSL_KNOWN_PARAMS)}"
                     )
 
             # Extract fields from curly braces (e.g., "insights.level(ad){ad_id,ad_name,spend}")
@@ -493,8 +599,10 @@ class PageLoader:
         extras = getattr(query_config, "parameters", None)
         if extras:
             if isinstance(extras, str):
-                pairs = (p.split("=", 1) for p in extras.split("&") if "=" in p)
-                params.update({k.strip(): v.strip() for k, v in pairs})
+                for pair in extras.split("&"):
+                    name, sep, value = pair.partition("=")
+                    if sep:
+                        params[name.strip()] = value.strip()
             elif isinstance(extras, dict):
                 params.update(extras)
         return params
@@ -512,6 +620,26 @@ class PageLoader:
 
         return "/" + "/".join(path_parts)
 
+    @staticmethod
+    def _parse_query_string(query: str) -> dict[str, Any]:
+        """Single-pass equivalent of ``parse_qs`` collapsed to scalars.
+
+        Blank values are dropped like ``parse_qs`` does; a key that repeats (which Graph API
+        paging URLs don't produce) keeps all its values as a list.
+        """
+        params: dict[str, Any] = {}
+        for pair in query.split("&"):
+            name, _, value = pair.partition("=")
+            if not value:
+                continue
+            name, value = unquote_plus(name), unquote_plus(value)
+            if name in params:
+                existing = params[name]
+                params[name] = [*existing, value] if isinstance(existing, list) else [existing, value]
+            else:
+                params[name] = value
+        return params
+
     def load_page_from_url(self, url: str) -> dict[str, Any]:
         """
         Load page data from a full Facebook API URL (used for pagination).
@@ -521,13 +649,11 @@ class PageLoader:
             parsed_url = urlparse(url)
             path = parsed_url.path
 
-            # Parse query parameters
-            query_params = parse_qs(parsed_url.query)
-            # Convert lists to single values (parse_qs returns lists)
-            params = {k: v[0] if isinstance(v, list) and len(v) == 1 else v for k, v in query_params.items()}
+            params = self._parse_query_string(parsed_url.query)
 
-            logger.debug(f"Loading paginated data from path: {path}")
-            logger.debug(f"Pagination params: {params}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Loading paginated data from path: {path}")
+                logger.debug(f"Pagination params: {params}")
 
             # Check if pagination should be skipped (e.g., future timestamps)
             should_skip, reason = PaginationHandler.should_skip_pagination(params)
@@ -543,10 +669,11 @@ class PageLoader:
 
         except HTTPError as e:
             # Raise UserException for misconfigured queries before checking recoverable errors
-            FacebookErrorHandler.raise_if_user_actionable(e)
+            error_context = FacebookErrorHandler.error_context(e)
+            FacebookErrorHandler.raise_if_user_actionable(e, error_context)
 
             # Check for recoverable errors
-            is_recoverable, error_desc = FacebookErrorHandler.is_recoverable_error(e)
+            is_recoverable, error_desc = FacebookErrorHandler.is_recoverable_error(e, error_context)
             if is_recoverable:
                 logger.warning(f"Skipping account: {error_desc}")
                 return {"data": []}
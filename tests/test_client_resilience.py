@@ -10,21 +10,45 @@ which production never calls — so the resubmit/backoff it asserted was dead co
 Every test here goes through a client method that a job invokes.
 """
 
+import threading
+import time
 import unittest
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from keboola.component.exceptions import UserException
 from requests import HTTPError
-
-from client import FacebookClient, breakdowns_requiring_enablement
-from page_loader import _FB_TRANSIENT_ERROR_MAX_RETRIES, AsyncInsightsJobTransientError
+from requests.exceptions import JSONDecodeError as RequestsJSONDecodeError
+from requests.exceptions import RetryError
+
+from client import (
+    AccessTokenFilter,
+    CircuitBreaker,
+    FacebookClient,
+    PooledHttpClient,
+    breakdowns_requiring_enablement,
+)
+from page_loader import (
+    _ASYNC_POLL_MAX_DELAY,
+    _ASYNC_POLL_NEAR_DONE_DELAY,
+    _FB_TRANSIENT_ERROR_MAX_RETRIES,
+    AsyncInsightsJobTransientError,
+    AsyncPollCancelled,
+    CircuitOpenError,
+    PageLoader,
+    async_poll_delay,
+)
 
 
 def make_client() -> FacebookClient:
     oauth = MagicMock()
     oauth.data = {"access_token": "user-token"}
-    return FacebookClient(oauth, "v25.0")
+    client = FacebookClient(oauth, "v25.0")
+    # No network in unit tests: the batched status multi-get returns nothing, so every report
+    # falls through to the (mocked) per-report PageLoader poll.
+    client.client = MagicMock()
+    client.client.get.return_value = {}
+    return client
 
 
 def make_async_job_details(loader: MagicMock, parser: MagicMock, page_id: str = "act_123") -> dict:
@@ -42,7 +66,7 @@ def make_async_job_details(loader: MagicMock, parser: MagicMock, page_id: str =
     }
 
 
-@patch("client.time.sleep", return_value=None)
+@patch("client.sleep_unless_cancelled", return_value=None)
 class TestAsyncInsightsResubmit(unittest.TestCase):
     def test_resubmits_after_transient_failure_then_succeeds(self, _sleep):
         """A transient 'Job Failed' on poll triggers a real re-submit + re-poll in production."""
@@ -91,6 +115,21 @@ class TestAsyncInsightsResubmit(unittest.TestCase):
         self.assertEqual(results, [])
         self.assertEqual(client.skipped_objects, 1)
 
+    def test_failed_results_fetch_is_skipped_and_counted(self, _sleep):
+        """A report whose results can't be fetched is counted as skipped, not reported as empty."""
+        loader = PageLoader(MagicMock(), "async-insights-query", "v25.0")
+        loader.client.get.side_effect = HTTPError("500 Server Error")
+        parser = MagicMock()
+
+        client = make_client()
+        job_details = make_async_job_details(loader, parser)
+        client._poll_async_statuses_batched = MagicMock(return_value={"report-1": {"async_status": "Job Completed"}})
+        results = list(client._poll_and_process_async_jobs(job_details))
+
+        self.assertEqual(results, [])
+        self.assertEqual(client.skipped_objects, 1)
+        parser.iter_parsed_data.assert_not_called()
+
     def test_programming_error_propagates_not_swallowed(self, _sleep):
         """A KeyError (real bug) must crash the job, not be masked as a skipped object."""
         loader = MagicMock()
@@ -102,6 +141,257 @@ class TestAsyncInsightsResubmit(unittest.TestCase):
         with self.assertRaises(KeyError):
             list(client._poll_and_process_async_jobs(make_async_job_details(loader, parser)))
 
+    def test_parse_error_stops_reports_still_polling(self, _sleep):
+        """A crash while parsing one report must not wait out the polling budget of the others."""
+        loader = MagicMock()
+        loader.poll_async_job.return_value = {"data": [{"impressions": "5"}]}
+        parser = MagicMock()
+        parser.iter_parsed_data.side_effect = KeyError("regression")
+        pending_loader = MagicMock()
+        pending_loader.poll_async_job.side_effect = lambda report_id, token, deadline, cancel: (
+            cancel.wait(timeout=30) and {"data": []}
+        )
+        details = make_async_job_details(loader, parser)
+        details["report-2"] = {**make_async_job_details(pending_loader, MagicMock())["report-1"]}
+
+        client = make_client()
+        started = time.monotonic()
+        with self.assertRaises(KeyError):
+            list(client._poll_and_process_async_jobs(details))
+        self.assertLess(time.monotonic() - started, 5)
+
+    def test_reports_are_polled_concurrently_but_yielded_in_order(self, _sleep):
+        """A slow first report must not block polling of the next one; output order is stable."""
+        second_polled = threading.Event()
+
+        slow_loader = MagicMock()
+        slow_loader.poll_async_job.side_effect = lambda *_: (
+            {"data": [{"n": "1"}]} if second_polled.wait(timeout=5) else {"data": []}
+        )
+        fast_loader = MagicMock()
+        fast_loader.poll_async_job.side_effect = lambda *_: second_polled.set() or {"data": [{"n": "2"}]}
+        slow_parser, fast_parser = MagicMock(), MagicMock()
+        slow_parser.iter_parsed_data.return_value = iter([{"q": [{"n": "1"}]}])
+        fast_parser.iter_parsed_data.return_value = iter([{"q": [{"n": "2"}]}])
+
+        details = make_async_job_details(slow_loader, slow_parser)
+        details["report-2"] = {**make_async_job_details(fast_loader, fast_parser)["report-1"]}
+
+        client = make_client()
+        results = list(client._poll_and_process_async_jobs(details))
+
+        self.assertEqual(results, [{"q": [{"n": "1"}]}, {"q": [{"n": "2"}]}])
+        self.assertEqual(client.skipped_objects, 0)
+
+    def test_batched_status_poll_skips_per_report_polling(self, _sleep):
+        """Reports seen completed in the ?ids= multi-get go straight to fetching results."""
+        loader = MagicMock()
+        loader.get_async_job_results.return_value = {"data": [{"impressions": "5"}]}
+        parser = MagicMock()
+        parser.iter_parsed_data.return_value = iter([{"q": [{"impressions": "5"}]}])
+
+        client = make_client()
+        client.client.get.side_effect = [
+            {"report-1": {"async_status": "Job Running", "async_percent_completion": 40}},
+            {"report-1": {"async_status": "Job Completed", "async_percent_completion": 100}},
+        ]
+        results = list(client._poll_and_process_async_jobs(make_async_job_details(loader, parser)))
+
+        self.assertEqual(results, [{"q": [{"impressions": "5"}]}])
+        self.assertEqual(client.client.get.call_count, 2)
+        self.assertEqual(client.client.get.call_args.kwargs["params"]["ids"], "report-1")
+        loader.get_async_job_results.assert_called_once_with("report-1", "tok")
+        loader.poll_async_job.assert_not_called()
+
+    def test_failed_batched_status_poll_falls_back_to_per_report(self, _sleep):
+        loader = MagicMock()
+        loader.poll_async_job.return_value = {"data": [{"impressions": "5"}]}
+        parser = MagicMock()
+        parser.iter_parsed_data.return_value = iter([{"q": [{"impressions": "5"}]}])
+
+        client = make_client()
+        client.client.get.side_effect = HTTPError("400 Client Error")
+        results = list(client._poll_and_process_async_jobs(make_async_job_details(loader, parser)))
+
+        self.assertEqual(results, [{"q": [{"impressions": "5"}]}])
+        loader.poll_async_job.assert_called_once()
+        self.assertEqual(loader.poll_async_job.call_args.args[:2], ("report-1", "tok"))
+
+    def test_report_pending_at_batch_deadline_is_resubmitted_without_a_second_full_wait(self, _sleep):
+        loader = MagicMock()
+        loader.poll_async_job.side_effect = [
+            AsyncInsightsJobTransientError("report report-1 did not complete within timeout"),
+            {"data": [{"impressions": "5"}]},
+        ]
+        loader.start_async_insights_job.return_value = "report-2"
+        parser = MagicMock()
+        parser.iter_parsed_data.return_value = iter([{"q": [{"impressions": "5"}]}])
+
+        client = make_client()
+        client.client.get.return_value = {"report-1": {"async_status": "Job Running", "async_percent_completion": 10}}
+        with patch("client._ASYNC_POLL_TIMEOUT", 0):
+            results = list(client._poll_and_process_async_jobs(make_async_job_details(loader, parser)))
+
+        self.assertEqual(results, [{"q": [{"impressions": "5"}]}])
+        first_poll, resubmitted_poll = loader.poll_async_job.call_args_list
+        self.assertLessEqual(first_poll.args[2], time.monotonic())  # the batch budget is already spent
+        self.assertEqual(resubmitted_poll.args[:3], ("report-2", "tok", None))  # a fresh budget after re-submit
+
+    def test_completed_reports_are_parsed_while_later_ones_are_still_running(self, _sleep):
+        first_parsed = threading.Event()
+        loader = MagicMock()
+        loader.get_async_job_results.return_value = {"data": [{"impressions": "5"}]}
+        first_parser, second_parser = MagicMock(), MagicMock()
+        first_parser.iter_parsed_data.side_effect = lambda *_: first_parsed.set() or iter([{"q": [{"n": "1"}]}])
+        second_parser.iter_parsed_data.return_value = iter([{"q": [{"n": "2"}]}])
+        details = make_async_job_details(loader, first_parser)
+        details["report-2"] = {**details["report-1"], "output_parser": second_parser}
+
+        def statuses(path, params):
+            if "report-1" in params["ids"]:  # first round: only report-1 is done
+                return {"report-1": {"async_status": "Job Completed"}, "report-2": {"async_status": "Job Running"}}
+            # report-2 only completes once report-1 has been parsed, i.e. parsing didn't wait for it
+            return {"report-2": {"async_status": "Job Completed" if first_parsed.wait(timeout=5) else "Job Running"}}
+
+        client = make_client()
+        client.client.get.side_effect = statuses
+        results = list(client._poll_and_process_async_jobs(details))
+
+        self.assertEqual(results, [{"q": [{"n": "1"}]}, {"q": [{"n": "2"}]}])
+        self.assertTrue(first_parsed.is_set())
+
+
+class TestAsyncPollDelay(unittest.TestCase):
+    def test_delay_is_jittered_within_a_capped_exponential_ceiling(self):
+        for attempt, ceiling in [(0, 1.0), (2, 4.0), (10, _ASYNC_POLL_MAX_DELAY)]:
+            delays = [async_poll_delay(attempt) for _ in range(200)]
+            self.assertTrue(all(0 <= d <= ceiling for d in delays))
+            self.assertGreater(len(set(delays)), 1)
+
+    def test_nearly_finished_job_is_polled_sooner(self):
+        delays = [async_poll_delay(10, percent_complete=90) for _ in range(200)]
+        self.assertTrue(all(d <= _ASYNC_POLL_NEAR_DONE_DELAY for d in delays))
+
+    def test_cancelled_poll_stops_before_the_next_request(self):
+        loader = PageLoader(MagicMock(), "async-insights-query", "v25.0")
+        cancel = threading.Event()
+        cancel.set()
+        with self.assertRaises(AsyncPollCancelled):
+            loader.poll_async_job("report-1", "tok", cancel=cancel)
+        loader.client.get.assert_not_called()
+
+    def test_poll_with_spent_deadline_goes_straight_to_resubmission(self):
+        loader = PageLoader(MagicMock(), "async-insights-query", "v25.0")
+        with self.assertRaises(AsyncInsightsJobTransientError):
+            loader.poll_async_job("report-1", "tok", deadline=time.monotonic() - 1)
+        loader.client.get.assert_not_called()
+
+
+class TestPooledHttpClient(unittest.TestCase):
+    def test_requests_share_one_connection_pool(self):
+        """Every request session gets the same adapter, so keep-alive connections are reused."""
+        oauth = MagicMock()
+        oauth.data = {"access_token": "user-token"}
+        client = FacebookClient(oauth, "v25.0").client
+        self.assertIsInstance(client, PooledHttpClient)
+
+        first = client._requests_retry_session()
+        second = client._requests_retry_session()
+
+        self.assertIsNot(first, second)
+        self.assertIs(first.get_adapter("https://graph.facebook.com"), second.get_adapter("https://graph.facebook.com"))
+
+    def test_get_decodes_json_and_keeps_requests_decode_error(self):
+        client = PooledHttpClient(base_url="https://graph.facebook.com")
+        response = MagicMock()
+        response.content = b'{"data": [{"id": "1", "spend": 1.5}]}'
+        with patch.object(client, "get_raw", return_value=response):
+            self.assertEqual(client.get("/v25.0/me"), {"data": [{"id": "1", "spend": 1.5}]})
+
+        response.content = b"<html>"
+        with patch.object(client, "get_raw", return_value=response):
+            with self.assertRaises(RequestsJSONDecodeError):
+                client.get("/v25.0/me")
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_consecutive_outage_failures_and_recovers(self):
+        client = PooledHttpClient(base_url="https://graph.facebook.com", breaker=CircuitBreaker(3, reset_timeout=30))
+        with patch("keboola.http_client.HttpClient._request_raw", side_effect=RetryError("too many 500s")) as raw:
+            for _ in range(3):
+                with self.assertRaises(RetryError):
+                    client.get_raw("/v25.0/me")
+            with self.assertRaises(CircuitOpenError):
+                client.get_raw("/v25.0/me")
+            self.assertEqual(raw.call_count, 3)
+
+        # After the cooldown the breaker lets a probe through; a response closes it.
+        with (
+            patch("client.time.monotonic", return_value=time.monotonic() + 31),
+            patch("keboola.http_client.HttpClient._request_raw", return_value=MagicMock()) as raw,
+        ):
+            client.get_raw("/v25.0/me")
+            raw.assert_called_once()
+        client.breaker.before_request()  # closed again
+
+    def test_client_errors_do_not_trip_the_breaker(self):
+        breaker = CircuitBreaker(1)
+        client = PooledHttpClient(base_url="https://graph.facebook.com", breaker=breaker)
+        response = MagicMock(status_code=400)
+        with patch("keboola.http_client.HttpClient._request_raw", return_value=response):
+            for _ in range(3):
+                self.assertIs(client.get_raw("/v25.0/me"), response)
+        breaker.before_request()
+
+    def test_half_open_lets_a_single_probe_through(self):
+        breaker = CircuitBreaker(1, reset_timeout=30)
+        breaker.record_failure()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+
+        with patch("client.time.monotonic", return_value=time.monotonic() + 31):
+            breaker.before_request()  # the probe
+            with self.assertRaises(CircuitOpenError):
+                breaker.before_request()  # others wait for its outcome
+            breaker.record_failure()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()  # failed probe re-opened the breaker
+
+    def test_open_circuit_fails_the_run_instead_of_skipping_objects(self):
+        self.assertTrue(issubclass(CircuitOpenError, UserException))
+        client = make_client()
+        client._request_require_page_token = MagicMock(return_value=False)
+        client._get_fb_graph_node = MagicMock(return_value="page")
+        accounts = [SimpleNamespace(id="p1"), SimpleNamespace(id="p2")]
+        with patch("client.PageLoader") as MockPL:
+            MockPL.return_value.load_page.side_effect = CircuitOpenError("Facebook API is temporarily unavailable")
+            with self.assertRaises(CircuitOpenError):
+                list(client._process_single_sync_query(accounts, make_sync_row()))
+
+    def test_async_reports_that_fail_to_start_are_counted(self):
+        client = make_client()
+        client._request_require_page_token = MagicMock(return_value=False)
+        client._get_fb_graph_node = MagicMock(return_value="ad_account")
+        accounts = [SimpleNamespace(id="act_1"), SimpleNamespace(id="act_2")]
+        with patch("client.PageLoader") as MockPL:
+            MockPL.return_value.start_async_insights_job.side_effect = ["report-1", None]
+            job_details = client._start_async_jobs_for_query(accounts, make_sync_row())
+
+        self.assertEqual(list(job_details), ["report-1"])
+        self.assertEqual(client.skipped_objects, 1)
+
+
+class TestAccessTokenFilter(unittest.TestCase):
+    def test_masks_query_string_and_dict_tokens(self):
+        masked = AccessTokenFilter()._mask("GET /me?access_token=abc&x=1 {'access_token': 'abc'}")
+        self.assertEqual(masked, "GET /me?access_token=---ACCESS-TOKEN---&x=1 {'access_token': '---ACCESS-TOKEN---'}")
+
+    def test_leaves_token_free_values_untouched(self):
+        error = ValueError("boom")
+        args = (1, 2.5, None)
+        self.assertIs(AccessTokenFilter()._mask(error), error)
+        self.assertIs(AccessTokenFilter()._mask(args), args)
+
 
 def make_sync_row(path: str = "feed") -> MagicMock:
     row = MagicMock()
@@ -151,6 +441,44 @@ class TestSyncPaginationResilience(unittest.TestCase):
         with self.assertRaises(UserException):
             list(client._process_single_sync_query(accounts, make_sync_row()))
 
+    def test_first_pages_load_concurrently_and_objects_keep_their_order(self, MockPL, MockOP):
+        client, parser, _ = self._prepare(MockPL, MockOP)
+        accounts = [SimpleNamespace(id=f"p{i}") for i in range(5)]
+        barrier = threading.Barrier(2, timeout=5)
+
+        def load_page(query, page_id, params):
+            if page_id in ("p0", "p1"):
+                barrier.wait()  # only returns if both first pages are in flight at once
+            if page_id == "p2":
+                raise HTTPError("500 Server Error")
+            return {"data": [{"id": page_id}]}
+
+        MockPL.return_value.load_page.side_effect = load_page
+        parser.iter_parsed_data.side_effect = lambda page_data, node, page_id: iter([{"id": page_id}])
+
+        results = list(client._process_single_sync_query(accounts, make_sync_row()))
+
+        self.assertEqual([r["id"] for r in results], ["p0", "p1", "p3", "p4"])
+        self.assertEqual(client.skipped_objects, 1)  # the failed first page is counted
+
+
+class TestBatchIdsRequest(unittest.TestCase):
+    def test_ids_are_fetched_in_chunks_of_fifty_in_order(self):
+        client = make_client()
+        client.client.get.side_effect = lambda path, params: {i: {"id": i} for i in params["ids"].split(",")}
+        account_ids = [f"p{i}" for i in range(120)]
+
+        responses = client._fetch_batch_responses(account_ids, "id")
+
+        self.assertEqual(client.client.get.call_count, 3)
+        self.assertEqual([list(r) for r in responses], [account_ids[:50], account_ids[50:100], account_ids[100:]])
+
+    def test_invalid_chunk_response_returns_none(self):
+        client = make_client()
+        client.client.get.side_effect = [{"p0": {"id": "p0"}}, {}]
+
+        self.assertIsNone(client._fetch_batch_responses([f"p{i}" for i in range(60)], "id"))
+
 
 def make_async_row(parameters: str = "", fields: str = "", name: str = "ad_perf") -> SimpleNamespace:
     """A minimal async-insights row_config with a real query for breakdown detection."""
@@ -185,7 +513,7 @@ class TestBreakdownsRequiringEnablement(unittest.TestCase):
         self.assertEqual(breakdowns_requiring_enablement(None), [])
 
 
-@patch("client.time.sleep", return_value=None)
+@patch("client.sleep_unless_cancelled", return_value=None)
 class TestBreakdownEnablementWarning(unittest.TestCase):
     """An empty async result for a gated-breakdown query must be explained, not silent."""
 
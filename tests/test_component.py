@@ -10,7 +10,7 @@ from unittest import mock
 
 from freezegun import freeze_time
 
-from component import Component
+from component import Component, WriterCacheRecord
 
 
 class TestComponent(unittest.TestCase):
@@ -24,5 +24,46 @@ class TestComponent(unittest.TestCase):
             comp.run()
 
 
+@mock.patch("component.ElasticDictWriter")
+@mock.patch.object(Component, "write_manifest")
+@mock.patch.object(Component, "create_out_table_definition")
+class TestBackgroundTableWriter(unittest.TestCase):
+    def _component(self) -> Component:
+        comp = Component.__new__(Component)  # skip ComponentBase: no data dir needed
+        comp._writer_cache = {}
+        comp.bucket_id = "in.c-meta"
+        return comp
+
+    def test_batches_are_written_in_order_then_finalized_after_the_sentinel(self, _table_def, write_manifest, Writer):
+        comp = self._component()
+        comp._write_rows("posts", [{"id": "1"}], ["id"], True)
+        comp._write_rows("posts", [{"id": "2"}, {"id": "3"}], [], True)
+
+        comp._finalize_tables()
+
+        record = comp._writer_cache["posts"]
+        self.assertFalse(record.thread.is_alive())
+        writer = Writer.return_value
+        self.assertEqual(
+            writer.writerows.call_args_list, [mock.call([{"id": "1"}]), mock.call([{"id": "2"}, {"id": "3"}])]
+        )
+        writer.writeheader.assert_called_once()
+        writer.close.assert_called_once()
+        write_manifest.assert_called_once_with(record.table_definition)
+
+    def test_write_error_is_raised_on_the_next_batch(self, _table_def, _write_manifest, Writer):
+        Writer.return_value.writerows.side_effect = OSError("No space left on device")
+        comp = self._component()
+        comp._write_rows("posts", [{"id": "1"}], ["id"], True)
+        comp._writer_cache["posts"].batches.join()  # the writer thread has handled the batch
+
+        with self.assertRaisesRegex(OSError, "No space left"):
+            comp._write_rows("posts", [{"id": "2"}], [], True)
+
+    def test_queue_holds_only_a_couple_of_batches(self, *_):
+        record = WriterCacheRecord(writer=mock.MagicMock(), table_definition=mock.MagicMock())
+        self.assertEqual(record.batches.maxsize, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
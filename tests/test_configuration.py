@@ -1,5 +1,8 @@
 """Unit tests for the Configuration model (CFTL-630 v1_compatibility flag)."""
 
+import pytest
+from pydantic import ValidationError
+
 from configuration import Configuration
 
 
@@ -11,3 +14,20 @@ def test_v1_compatibility_defaults_to_false():
 def test_v1_compatibility_reads_true_from_parameters():
     cfg = Configuration(**{"accounts": {}, "queries": [], "v1_compatibility": True})
     assert cfg.v1_compatibility is True
+
+
+def test_query_rows_are_immutable_and_hashable():
+    cfg = Configuration(
+        **{"queries": [{"id": 1, "type": "nested-query", "name": "q", "query": {"path": "feed", "fields": "id"}}]}
+    )
+    row = cfg.queries[0]
+    assert hash(row) == hash(row.model_copy())
+    with pytest.raises(ValidationError):
+        row.name = "other"
+
+
+def test_query_ids_are_canonicalized():
+    cfg = Configuration(
+        **{"queries": [{"id": 1, "type": "nested-query", "name": "q", "query": {"ids": " act_1 , act_2,"}}]}
+    )
+    assert cfg.queries[0].query.ids == "act_1,act_2"
@@ -209,6 +209,71 @@ class TestParseDataCompatibility(unittest.TestCase):
         self.assertIn("my_query_insights", result)
         self.assertEqual(len(result["my_query_insights"]), 6)
 
+    def test_pagination_stops_on_url_cycle(self):
+        url_a = "https://graph.facebook.com/v20.0/act_1/insights?after=A"
+        url_b = "https://graph.facebook.com/v20.0/act_1/insights?after=B"
+        page_a = _make_insights_page(n_rows=1, next_url=url_b, row_offset=1)
+        page_b = _make_insights_page(n_rows=1, next_url=url_a, row_offset=2)
+        loader = _FakePageLoader(follow_up_pages=[page_a, page_b, page_a])
+
+        parser = OutputParser(loader, page_id="act_1", row_config=_make_row_config())
+        result = parser.parse_data(
+            _make_insights_page(n_rows=1, next_url=url_a), fb_node="page_insights", parent_id="act_1"
+        )
+
+        self.assertEqual(loader.load_calls, [url_a, url_b])
+        self.assertEqual(len(result["my_query_insights"]), 3)
+
+    def test_flatten_array_keeps_depth_first_key_order(self):
+        parser = OutputParser(None, page_id="act_1", row_config=_make_row_config())
+        flat = parser._flatten_array("t", {"a": [1, {"b": 2, "c": []}], "d": {"e": None}, "f": "x"})
+
+        self.assertEqual(list(flat.items()), [("t_a_0", 1), ("t_a_1_b", 2), ("t_d_e", None), ("t_f", "x")])
+
+    def test_action_breakdowns_are_parsed_in_order(self):
+        parse = OutputParser._parse_action_breakdowns
+        self.assertEqual(
+            parse("level=ad&action_breakdowns=action_type, action_reaction"), ("action_type", "action_reaction")
+        )
+        self.assertEqual(parse("action_breakdowns=action_type_foo"), ("action_type_foo",))
+        self.assertEqual(parse(None), ())
+
+    def test_only_the_first_action_breakdown_selects_action_rows(self):
+        row = {
+            "account_id": "act_1",
+            "campaign_id": "c-1",
+            "spend": "1.00",
+            "date_start": "2026-01-01",
+            "date_stop": "2026-01-01",
+            "actions": [{"action_type": "link_click", "action_device": "iphone", "value": "10"}],
+        }
+
+        def process(parameters: str) -> dict:
+            parser = OutputParser(MagicMock(), "act_1", _make_row_config(parameters=parameters))
+            result = {}
+            base_row = parser._create_base_row("page_insights", "act_1")
+            parser._process_row(row, "page_insights", "my_query_insights", base_row, result)
+            return result
+
+        action = {"ads_action_name": "actions", "action_type": "link_click", "value": "10", "action_device": "iphone"}
+        common = {
+            "ex_account_id": "act_1",
+            "fb_graph_node": "page_insights",
+            "parent_id": "act_1",
+            "account_id": "act_1",
+            "campaign_id": "c-1",
+            "date_start": "2026-01-01",
+            "date_stop": "2026-01-01",
+        }
+        full_row = {"my_query_insights": [{**common, "spend": "1.00", **action}]}
+        # Actions stay appended to the full insights row (metrics included) unless action_type comes first
+        self.assertEqual(process("action_breakdowns=action_device"), full_row)
+        self.assertEqual(process("action_breakdowns=action_device,action_type"), full_row)
+        # action_type first: action rows carry only the common id/date columns
+        self.assertEqual(
+            process("action_breakdowns=action_type,action_device"), {"my_query_insights": [{**common, **action}]}
+        )
+
 
 if __name__ == "__main__":
     unittest.main()